@@ -7,6 +7,9 @@ PLUGIN_CFG = settings.PLUGINS_CONFIG["nautobot_ssot_device42"]
 
 DEFAULTS = PLUGIN_CFG.get("defaults")
 
+# Number of objects written per INSERT/UPDATE when bulk importing into Nautobot.
+BULK_BATCH_SIZE = int(PLUGIN_CFG.get("bulk_batch_size", 500))
+
 PHY_INTF_MAP = {  # pylint: disable=invalid-name
     "100 Mbps": "100base-tx",
     "1.0 Gbps": "1000base-t",
@@ -1,12 +1,12 @@
 """DiffSync adapter for Device42."""
 
 import re
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
 from typing import List
 
 from diffsync import DiffSync
 from diffsync.exceptions import ObjectAlreadyExists, ObjectNotFound
-from django.utils.text import slugify
 from nautobot.core.settings_funcs import is_truthy
 from netutils.bandwidth import name_to_bits
 from netutils.dns import fqdn_to_ip, is_fqdn_resolvable
@@ -20,8 +20,9 @@ from nautobot_ssot_device42.utils.device42 import (
     get_netmiko_platform,
     get_custom_field_dict,
     load_vlan,
+    normalize_mac,
 )
-from nautobot_ssot_device42.utils.nautobot import determine_vc_position
+from nautobot_ssot_device42.utils.nautobot import determine_vc_position, get_slug, is_truthy_cached
 
 
 def sanitize_string(san_str: str):
@@ -138,6 +139,13 @@ class Device42Adapter(DiffSync):
         self.device42_hardware_dict = {}
         self.device42 = client
         self.device42_clusters = self.device42.get_cluster_members()
+        # mapping of cluster member Device name to cluster name
+        self.cluster_member_map = {}
+        # evaluate is_network once per cluster instead of for every member Device
+        for _cluster, _info in self.device42_clusters.items():
+            _info["is_network_bool"] = is_truthy(_info.get("is_network"))
+            for _member in _info["members"]:
+                self.cluster_member_map.setdefault(_member, _cluster)
         self.rack_elevations = {}
 
         # mapping of SiteCode (facility) to Building name
@@ -184,7 +192,7 @@ class Device42Adapter(DiffSync):
             else:
                 _building = dev_record.get("building")
         if _building is not None:
-            return slugify(_building)
+            return get_slug(_building)
         return ""
 
     def load_buildings(self):
@@ -217,6 +225,7 @@ class Device42Adapter(DiffSync):
 
     def load_rooms(self):
         """Load Device42 rooms."""
+        buildings_by_name = {_building.name: _building for _building in self.get_all(self.building)}
         for record in self.device42.get_rooms():
             self.job.log_info(message=f"Loading {record['name']} room from Device42.")
             _tags = record["tags"] if record.get("tags") else []
@@ -237,8 +246,7 @@ class Device42Adapter(DiffSync):
                 )
                 try:
                     self.add(room)
-                    _site = self.get(self.building, record.get("building"))
-                    _site.add_child(child=room)
+                    buildings_by_name[record["building"]].add_child(child=room)
                 except ObjectAlreadyExists as err:
                     if self.job.kwargs.get("debug"):
                         self.job.log_warning(message=f"{record['name']} is already loaded. {err}")
@@ -249,6 +257,7 @@ class Device42Adapter(DiffSync):
     def load_racks(self):
         """Load Device42 racks."""
         self.job.log_info(message="Loading racks from Device42.")
+        rooms_by_building = {(_room.building, _room.name): _room for _room in self.get_all(self.room)}
         for record in self.device42.get_racks():
             _tags = record["tags"] if record.get("tags") else []
             if len(_tags) > 1:
@@ -269,10 +278,7 @@ class Device42Adapter(DiffSync):
                 )
                 try:
                     self.add(rack)
-                    _room = self.get(
-                        self.room, {"name": record["room"], "building": record["building"], "room": record["room"]}
-                    )
-                    _room.add_child(child=rack)
+                    rooms_by_building[(record["building"], record["room"])].add_child(child=rack)
                 except ObjectAlreadyExists as err:
                     if self.job.kwargs.get("debug"):
                         self.job.log_warning(message=f"Rack {record['name']} already exists. {err}")
@@ -321,10 +327,7 @@ class Device42Adapter(DiffSync):
         Returns:
             str: Name of cluster device is part of or empty string.
         """
-        for _cluster, _info in self.device42_clusters.items():
-            if device in _info["members"]:
-                return _cluster
-        return ""
+        return self.cluster_member_map.get(device, "")
 
     def load_cluster(self, cluster_info: dict):
         """Load Device42 clusters into DiffSync model.
@@ -378,103 +381,110 @@ class Device42Adapter(DiffSync):
                 vc_position=1,
                 uuid=None,
             )
-            self.add(_device)
+            try:
+                self.add(_device)
+            except ObjectAlreadyExists as err:
+                self.job.log_warning(message=f"Duplicate device attempting to be added. {err}")
 
     def load_devices_and_clusters(self):
-        """Load Device42 devices."""
+        """Load Device42 devices.
+
+        Devices are streamed from Device42 one page at a time and loaded in the order they're returned, so a Cluster
+        isn't guaranteed to be loaded before its member Devices. Loading a member Device only relies upon the
+        `device42_clusters` mapping, retrieved before this is called, and not upon the loaded Cluster models. Should a
+        Device share its name with a Cluster, whichever record is returned first is loaded and the other is logged as
+        a duplicate.
+        """
         self.job.log_info(message="Retrieving devices from Device42.")
-        _devices = self.device42.get_devices()
-
-        # Add all Clusters first
-        for _record in _devices:
-            if _record.get("type") == "cluster" and _record.get("name") in self.device42_clusters:
-                self.load_cluster(_record)
-
-        # Then iterate through again and add Devices
-        for _record in _devices:
-            rack_position, model = None, None
-            self.job.log_info(message=f"Device {_record['name']} being loaded.")
-            _building = self.get_building_for_device(dev_record=_record)
-            # only consider devices that have a Building
-            if _building == "":
+        for _record in self.device42.stream_devices():
+            if _record.get("type") == "cluster":
+                if _record.get("name") in self.device42_clusters:
+                    self.load_cluster(_record)
+            else:
+                self.load_device(_record)
+
+    def load_device(self, _record: dict):
+        """Load Device42 device into DiffSync model.
+
+        Args:
+            _record (dict): Device record from Device42 API.
+        """
+        rack_position, model = None, None
+        self.job.log_info(message=f"Device {_record['name']} being loaded.")
+        _building = self.get_building_for_device(dev_record=_record)
+        # only consider devices that have a Building
+        if _building == "":
+            self.job.log_warning(
+                message=f"Device {_record['name']} can't be loaded as we're unable to find associated Building."
+            )
+            return
+        if _record.get("hw_model"):
+            try:
+                model = self.get(self.hardware, sanitize_string(_record["hw_model"]))
+            except ObjectNotFound as err:
                 self.job.log_warning(
-                    message=f"Device {_record['name']} can't be loaded as we're unable to find associated Building."
+                    message=f"Unable to find hardware model {_record['hw_model']} for {_record['name']} so it will not be loaded. {err}"
                 )
-                continue
-            if _record.get("type") != "cluster" and _record.get("hw_model"):
-                try:
-                    model = self.get(self.hardware, sanitize_string(_record["hw_model"]))
-                except ObjectNotFound as err:
-                    self.job.log_warning(
-                        message=f"Unable to find hardware model {_record['hw_model']} for {_record['name']} so it will not be loaded. {err}"
-                    )
-                    continue
-                _tags = _record["tags"] if _record.get("tags") else []
-                if PLUGIN_CFG.get("ignore_tag") and PLUGIN_CFG["ignore_tag"] in _tags:
-                    self.job.log_warning(
-                        message=f"Skipping loading {_record['name']} as it has the specified ignore tag."
-                    )
-                    continue
-                if len(_tags) > 1:
-                    _tags.sort()
-                # Get size of model to ensure appropriate number of rack Us are filled
-                if model:
-                    model_size = int(model.size)
-                    if _record.get("start_at"):
-                        rack_position = int(_record["start_at"])
-                        for slot in range(rack_position, rack_position + model_size + 1):
-                            if _building not in self.rack_elevations:
-                                self.rack_elevations[_building] = {}
-
-                            if _record["room"] not in self.rack_elevations[_building]:
-                                self.rack_elevations[_building][_record["room"]] = {}
-
-                            if _record["rack"] not in self.rack_elevations[_building][_record["room"]]:
-                                self.rack_elevations[_building][_record["room"]][_record["rack"]] = {}
-
-                            if slot not in self.rack_elevations[_building][_record["room"]][_record["rack"]]:
-                                self.rack_elevations[_building][_record["room"]][_record["rack"]][slot] = []
-
-                            self.rack_elevations[_building][_record["room"]][_record["rack"]][slot].append(
-                                _record["name"][:64]
-                            )
+                return
+            _tags = _record["tags"] if _record.get("tags") else []
+            if PLUGIN_CFG.get("ignore_tag") and PLUGIN_CFG["ignore_tag"] in _tags:
+                self.job.log_warning(message=f"Skipping loading {_record['name']} as it has the specified ignore tag.")
+                return
+            if len(_tags) > 1:
+                _tags.sort()
+            # Get size of model to ensure appropriate number of rack Us are filled
+            if model:
+                model_size = int(model.size)
+                if _record.get("start_at"):
+                    rack_position = int(_record["start_at"])
+                    for slot in range(rack_position, rack_position + model_size + 1):
+                        if _building not in self.rack_elevations:
+                            self.rack_elevations[_building] = {}
+
+                        if _record["room"] not in self.rack_elevations[_building]:
+                            self.rack_elevations[_building][_record["room"]] = {}
+
+                        if _record["rack"] not in self.rack_elevations[_building][_record["room"]]:
+                            self.rack_elevations[_building][_record["room"]][_record["rack"]] = {}
+
+                        if slot not in self.rack_elevations[_building][_record["room"]][_record["rack"]]:
+                            self.rack_elevations[_building][_record["room"]][_record["rack"]][slot] = []
+
+                        self.rack_elevations[_building][_record["room"]][_record["rack"]][slot].append(
+                            _record["name"][:64]
+                        )
 
-                        if (
-                            len(
-                                self.rack_elevations[_building][_record["room"]][_record["rack"]][
-                                    int(_record["start_at"])
-                                ]
-                            )
-                            > 1
-                        ):
-                            rack_position = None
-                _device = self.device(
-                    name=_record["name"][:64],
-                    building=_building,
-                    room=_record["room"] if _record.get("room") else "",
-                    rack=_record["rack"] if _record.get("rack") else "",
-                    rack_position=rack_position,
-                    rack_orientation="front" if _record.get("orientation") == 1 else "rear",
-                    hardware=sanitize_string(_record["hw_model"]),
-                    os=get_netmiko_platform(_record["os"][:100]) if _record.get("os") else "",
-                    os_version=re.sub(r"^[a-zA-Z]+\s", "", _record["osver"]) if _record.get("osver") else "",
-                    in_service=_record.get("in_service"),
-                    serial_no=_record["serial_no"],
-                    master_device=False,
-                    tags=_tags,
-                    custom_fields=get_custom_field_dict(_record["custom_fields"]),
-                    cluster_host=None,
-                    vc_position=None,
-                    uuid=None,
-                )
-                self.assign_cluster_host(_record, _device)
-                try:
-                    self.add(_device)
-                except ObjectAlreadyExists as err:
-                    self.job.log_warning(message=f"Duplicate device attempting to be added. {err}")
-                    continue
-            elif _record.get("type") != "cluster" and not _record.get("hw_model"):
-                self.job.log_warning(message=f"Device {_record['name']}'s hardware isn't specified so won't be loaded.")
+                    if (
+                        len(self.rack_elevations[_building][_record["room"]][_record["rack"]][int(_record["start_at"])])
+                        > 1
+                    ):
+                        rack_position = None
+            _device = self.device(
+                name=_record["name"][:64],
+                building=_building,
+                room=_record["room"] if _record.get("room") else "",
+                rack=_record["rack"] if _record.get("rack") else "",
+                rack_position=rack_position,
+                rack_orientation="front" if _record.get("orientation") == 1 else "rear",
+                hardware=sanitize_string(_record["hw_model"]),
+                os=get_netmiko_platform(_record["os"][:100]) if _record.get("os") else "",
+                os_version=re.sub(r"^[a-zA-Z]+\s", "", _record["osver"]) if _record.get("osver") else "",
+                in_service=_record.get("in_service"),
+                serial_no=_record["serial_no"],
+                master_device=False,
+                tags=_tags,
+                custom_fields=get_custom_field_dict(_record["custom_fields"]),
+                cluster_host=None,
+                vc_position=None,
+                uuid=None,
+            )
+            self.assign_cluster_host(_record, _device)
+            try:
+                self.add(_device)
+            except ObjectAlreadyExists as err:
+                self.job.log_warning(message=f"Duplicate device attempting to be added. {err}")
+        else:
+            self.job.log_warning(message=f"Device {_record['name']}'s hardware isn't specified so won't be loaded.")
 
     def assign_cluster_host(self, _record, _device):
         """Assign cluster host to loaded Device if found.
@@ -485,7 +495,7 @@ class Device42Adapter(DiffSync):
         """
         cluster_host = self.get_cluster_host(_record["name"])
         if cluster_host:
-            if not is_truthy(self.device42_clusters[cluster_host]["is_network"]):
+            if not self.device42_clusters[cluster_host]["is_network_bool"]:
                 self.job.log_warning(
                     message=f"{cluster_host} has network device members but isn't marked as network device. This should be corrected in Device42."
                 )
@@ -521,11 +531,16 @@ class Device42Adapter(DiffSync):
 
     def load_ports(self):
         """Load Device42 ports."""
-        vlan_ports = self.device42.get_ports_with_vlans()
-        no_vlan_ports = self.device42.get_ports_wo_vlans()
+        # The Port queries are independent and I/O bound so are issued concurrently.
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            vlan_ports_future = executor.submit(self.device42.get_ports_with_vlans)
+            no_vlan_ports_future = executor.submit(self.device42.get_ports_wo_vlans)
+            default_cfs_future = executor.submit(self.device42.get_port_default_custom_fields)
+            cfs_future = executor.submit(self.device42.get_port_custom_fields)
+            vlan_ports, no_vlan_ports = vlan_ports_future.result(), no_vlan_ports_future.result()
+            default_cfs, _cfs = default_cfs_future.result(), cfs_future.result()
         merged_ports = self.filter_ports(vlan_ports, no_vlan_ports)
-        default_cfs = self.device42.get_port_default_custom_fields()
-        _cfs = self.device42.get_port_custom_fields()
+        devices_by_name = {_device.name: _device for _device in self.get_all(self.device)}
         for _port in merged_ports:
             if _port.get("second_device_fk"):
                 _device_name = self.d42_device_map[_port["second_device_fk"]]["name"]
@@ -535,9 +550,8 @@ class Device42Adapter(DiffSync):
                 _port_name = _port["port_name"][:63].strip()
             else:
                 _port_name = _port["hwaddress"]
-            try:
-                _dev = self.get(self.device, _device_name)
-            except ObjectNotFound:
+            _dev = devices_by_name.get(_device_name)
+            if _dev is None:
                 if self.job.kwargs.get("debug"):
                     self.job.log_warning(
                         message=f"Skipping loading of Port {_port_name} for Device {_device_name} as device was not loaded."
@@ -549,16 +563,17 @@ class Device42Adapter(DiffSync):
             if len(_tags) > 1:
                 _tags.sort()
             _status = get_intf_status(port=_port)
+            _mtu = _port.get("mtu")
             try:
                 self.get(self.port, {"device": _device_name, "name": _port_name})
             except ObjectNotFound:
                 new_port = self.port(
                     name=_port_name,
                     device=_device_name,
-                    enabled=is_truthy(_port["up_admin"]),
-                    mtu=_port["mtu"] if _port.get("mtu") in range(1, 65537) else 1500,
+                    enabled=is_truthy_cached(_port["up_admin"]),
+                    mtu=_mtu if isinstance(_mtu, int) and 1 <= _mtu <= 65536 else 1500,
                     description=_port["description"],
-                    mac_addr=_port["hwaddress"][:13],
+                    mac_addr=normalize_mac(_port["hwaddress"]),
                     type=get_intf_type(intf_record=_port),
                     tags=_tags,
                     mode="access",
@@ -570,15 +585,14 @@ class Device42Adapter(DiffSync):
                 if _port.get("vlan_pks"):
                     _vlans = []
                     for _pk in _port["vlan_pks"]:
-                        if _pk in self.d42_vlan_map and self.d42_vlan_map[_pk]["vid"] != 0:
+                        _vid = self.d42_vlan_map[_pk]["vid"] if _pk in self.d42_vlan_map else 0
+                        if _vid != 0:
                             # Need to ensure that there's a VLAN loaded for every one that's being tagged.
                             try:
-                                self.get(
-                                    self.vlan, {"vlan_id": self.d42_vlan_map[_pk]["vid"], "building": _dev.building}
-                                )
+                                self.get(self.vlan, {"vlan_id": _vid, "building": _dev.building})
                             except ObjectNotFound:
-                                load_vlan(diffsync=self, vlan_id=self.d42_vlan_map[_pk]["vid"], site_name=_dev.building)
-                            _vlans.append(self.d42_vlan_map[_pk]["vid"])
+                                load_vlan(diffsync=self, vlan_id=_vid, site_name=_dev.building)
+                            _vlans.append(_vid)
                     new_port.vlans = sorted(set(_vlans))
                     if len(_vlans) > 1:
                         new_port.mode = "tagged"
@@ -713,6 +727,7 @@ class Device42Adapter(DiffSync):
     def load_vlans(self):
         """Load Device42 VLANs."""
         _vlans = self.device42.get_vlans_with_location()
+        _customer_is_facility = is_truthy(PLUGIN_CFG.get("customer_is_facility"))
         for _info in _vlans:
             _vlan_name = _info["vlan_name"].strip()
             building = None
@@ -721,14 +736,14 @@ class Device42Adapter(DiffSync):
             else:
                 _cfs = {}
             tags = _info["tags"].split(",").sort() if _info.get("tags") else []
-            if is_truthy(PLUGIN_CFG.get("customer_is_facility")) and _info.get("customer"):
+            if _customer_is_facility and _info.get("customer"):
                 building = self.d42_building_sitecode_map[_info["customer"].upper()]
             elif _info.get("building"):
                 building = _info["building"]
             load_vlan(
                 diffsync=self,
                 vlan_id=int(_info["vid"]),
-                site_name=slugify(building) if building else "Unknown",
+                site_name=get_slug(building) if building else "Unknown",
                 vlan_name=_vlan_name,
                 description=_info["description"] if _info.get("description") else "",
                 custom_fields=_cfs,
@@ -996,11 +1011,11 @@ class Device42Adapter(DiffSync):
             if PLUGIN_CFG.get("hostname_mapping") and len(PLUGIN_CFG["hostname_mapping"]) > 0:
                 _building = get_site_from_mapping(device_name=panel["name"])
             if not _building and PLUGIN_CFG.get("customer_is_facility") and panel["customer_fk"] is not None:
-                _building = slugify(self.d42_customer_map[panel["customer_fk"]]["name"])
+                _building = get_slug(self.d42_customer_map[panel["customer_fk"]]["name"])
             if not _building and panel["building_fk"] is not None:
-                _building = slugify(self.d42_building_map[panel["building_fk"]]["name"])
+                _building = get_slug(self.d42_building_map[panel["building_fk"]]["name"])
             if not _building and panel["calculated_building_fk"] is not None:
-                _building = slugify(self.d42_building_map[panel["calculated_building_fk"]]["name"])
+                _building = get_slug(self.d42_building_map[panel["calculated_building_fk"]]["name"])
             if panel["room_fk"] is not None:
                 _room = self.d42_room_map[panel["room_fk"]]["name"]
             if not _room and panel["calculated_room_fk"] is not None:
@@ -6,6 +6,7 @@ from collections import defaultdict
 from diffsync import DiffSync
 from diffsync.exceptions import ObjectAlreadyExists, ObjectNotFound
 from django.core.exceptions import ValidationError
+from django.db import transaction
 from django.db.models import ProtectedError
 from nautobot.circuits.models import Circuit, CircuitTermination, Provider
 from nautobot.dcim.models import (
@@ -28,7 +29,7 @@ from nautobot.extras.models import Relationship, RelationshipAssociation, Status
 from nautobot.ipam.models import VLAN, VRF, IPAddress, Prefix
 from netutils.lib_mapper import ANSIBLE_LIB_MAPPER
 
-from nautobot_ssot_device42.constant import PLUGIN_CFG
+from nautobot_ssot_device42.constant import BULK_BATCH_SIZE, PLUGIN_CFG
 from nautobot_ssot_device42.diffsync.models.nautobot import assets, circuits, dcim, ipam
 from nautobot_ssot_device42.utils import nautobot
 
@@ -114,7 +115,7 @@ class NautobotAdapter(DiffSync):
         super().__init__(*args, **kwargs)
         self.job = job
         self.sync = sync
-        self.objects_to_delete = defaultdict(list)
+        self.objects_to_delete = defaultdict(set)
         self.objects_to_create = defaultdict(list)
 
     def sync_complete(self, source: DiffSync, *args, **kwargs):
@@ -126,36 +127,62 @@ class NautobotAdapter(DiffSync):
         Args:
             source (DiffSync): DiffSync
         """
+        self._flush_changes()
+        return super().sync_complete(source, *args, **kwargs)
+
+    def _delete_individually(self, model, pks):
+        """Delete objects one at a time so each instance's delete() runs and protected objects are only logged.
+
+        Args:
+            model (Model): Nautobot model the objects belong to.
+            pks (set): Primary keys of the objects to be deleted.
+        """
+        for nautobot_object in model.objects.filter(id__in=pks):
+            try:
+                nautobot_object.delete()
+            except ProtectedError:
+                self.job.log(f"Deletion failed protected object: {nautobot_object}")
+
+    @transaction.atomic
+    def _flush_changes(self):
+        """Write the queued deletions and staged objects to Nautobot in a single transaction."""
         if PLUGIN_CFG.get("delete_on_sync"):
-            for grouping in (
-                "ipaddr",
-                "subnet",
-                "vrf",
-                "vlan",
-                "circuit",
-                "provider",
-                "cluster",
-                "port",
-                "device",
-                "patchpanel",
-                "device_type",
-                "manufacturer",
-                "rack",
-                "site",
+            for grouping, model in (
+                ("ipaddr", IPAddress),
+                ("subnet", Prefix),
+                ("vrf", VRF),
+                ("vlan", VLAN),
+                ("circuit", Circuit),
+                ("provider", Provider),
+                ("cluster", VirtualChassis),
+                ("port", Interface),
+                ("device", Device),
+                ("patchpanel", Device),
+                ("device_type", DeviceType),
+                ("manufacturer", Manufacturer),
+                ("rack", Rack),
+                ("site", Site),
             ):
-                for nautobot_object in self.objects_to_delete[grouping]:
-                    try:
-                        if self.job.kwargs.get("debug"):
-                            self.job.log_info(message=f"Deleting {nautobot_object}.")
-                        nautobot_object.delete()
-                    except ProtectedError:
-                        self.job.log(f"Deletion failed protected object: {nautobot_object}")
-                self.objects_to_delete[grouping] = []
+                if len(self.objects_to_delete[grouping]) > 0:
+                    if self.job.kwargs.get("debug"):
+                        self.job.log_info(
+                            message=f"Deleting {len(self.objects_to_delete[grouping])} {grouping} objects."
+                        )
+                    if model is VirtualChassis:
+                        # VirtualChassis.delete() refuses to orphan LAG members, a check a queryset delete() skips
+                        self._delete_individually(model, self.objects_to_delete[grouping])
+                    else:
+                        try:
+                            model.objects.filter(id__in=self.objects_to_delete[grouping]).delete()
+                        except ProtectedError:
+                            # fall back to deleting individually so only the protected objects are left behind
+                            self._delete_individually(model, self.objects_to_delete[grouping])
+                self.objects_to_delete[grouping] = set()
 
         if len(self.objects_to_create["sites"]) > 0:
             if self.job.kwargs["bulk_import"]:
                 self.job.log_info(message="Performing bulk create of Sites in Nautobot")
-                Site.objects.bulk_create(self.objects_to_create["sites"], batch_size=50)
+                Site.objects.bulk_create(self.objects_to_create["sites"], batch_size=BULK_BATCH_SIZE)
             else:
                 self.job.log_info(message="Performing creation of Sites in Nautobot.")
                 try:
@@ -166,7 +193,7 @@ class NautobotAdapter(DiffSync):
         if len(self.objects_to_create["rooms"]) > 0:
             if self.job.kwargs["bulk_import"]:
                 self.job.log_info(message="Performing bulk create of Sites in Nautobot")
-                RackGroup.objects.bulk_create(self.objects_to_create["rooms"], batch_size=50)
+                RackGroup.objects.bulk_create(self.objects_to_create["rooms"], batch_size=BULK_BATCH_SIZE)
             else:
                 self.job.log_info(message="Performing creation of RackGroups in Nautobot")
                 try:
@@ -177,7 +204,7 @@ class NautobotAdapter(DiffSync):
         if len(self.objects_to_create["racks"]) > 0:
             if self.job.kwargs["bulk_import"]:
                 self.job.log_info(message="Performing bulk create of Racks in Nautobot")
-                Rack.objects.bulk_create(self.objects_to_create["racks"], batch_size=50)
+                Rack.objects.bulk_create(self.objects_to_create["racks"], batch_size=BULK_BATCH_SIZE)
             else:
                 self.job.log_info(message="Performing creation of Racks in Nautobot")
                 try:
@@ -188,7 +215,7 @@ class NautobotAdapter(DiffSync):
         if len(self.objects_to_create["vendors"]) > 0:
             if self.job.kwargs["bulk_import"]:
                 self.job.log_info(message="Performing bulk create of Manufacturers in Nautobot")
-                Manufacturer.objects.bulk_create(self.objects_to_create["vendors"], batch_size=50)
+                Manufacturer.objects.bulk_create(self.objects_to_create["vendors"], batch_size=BULK_BATCH_SIZE)
             else:
                 self.job.log_info(message="Performing creation of Manufacturers in Nautobot")
                 try:
@@ -199,7 +226,7 @@ class NautobotAdapter(DiffSync):
         if len(self.objects_to_create["devicetypes"]) > 0:
             if self.job.kwargs["bulk_import"]:
                 self.job.log_info(message="Performing bulk create of DeviceTypes in Nautobot")
-                DeviceType.objects.bulk_create(self.objects_to_create["devicetypes"], batch_size=50)
+                DeviceType.objects.bulk_create(self.objects_to_create["devicetypes"], batch_size=BULK_BATCH_SIZE)
             else:
                 self.job.log_info(message="Performing creation of DeviceTypes in Nautobot")
                 try:
@@ -210,7 +237,7 @@ class NautobotAdapter(DiffSync):
         if len(self.objects_to_create["deviceroles"]) > 0:
             if self.job.kwargs["bulk_import"]:
                 self.job.log_info(message="Performing bulk create of DeviceRoles in Nautobot")
-                DeviceRole.objects.bulk_create(self.objects_to_create["deviceroles"], batch_size=50)
+                DeviceRole.objects.bulk_create(self.objects_to_create["deviceroles"], batch_size=BULK_BATCH_SIZE)
             else:
                 self.job.log_info(message="Performing creation of DeviceRoles in Nautobot")
                 try:
@@ -221,7 +248,7 @@ class NautobotAdapter(DiffSync):
         if len(self.objects_to_create["platforms"]) > 0:
             if self.job.kwargs["bulk_import"]:
                 self.job.log_info(message="Performing bulk create of Platforms in Nautobot")
-                Platform.objects.bulk_create(self.objects_to_create["platforms"], batch_size=50)
+                Platform.objects.bulk_create(self.objects_to_create["platforms"], batch_size=BULK_BATCH_SIZE)
             else:
                 self.job.log_info(message="Performing creation of Platforms in Nautobot")
                 try:
@@ -232,7 +259,7 @@ class NautobotAdapter(DiffSync):
         if len(self.objects_to_create["vrfs"]) > 0:
             if self.job.kwargs["bulk_import"]:
                 self.job.log_info(message="Performing bulk create of VRFs in Nautobot")
-                VRF.objects.bulk_create(self.objects_to_create["vrfs"], batch_size=50)
+                VRF.objects.bulk_create(self.objects_to_create["vrfs"], batch_size=BULK_BATCH_SIZE)
             else:
                 self.job.log_info(message="Performing creation of VRFs in Nautobot")
                 try:
@@ -243,7 +270,7 @@ class NautobotAdapter(DiffSync):
         if len(self.objects_to_create["vlans"]) > 0:
             if self.job.kwargs["bulk_import"]:
                 self.job.log_info(message="Performing bulk create of VLANs in Nautobot")
-                VLAN.objects.bulk_create(self.objects_to_create["vlans"], batch_size=50)
+                VLAN.objects.bulk_create(self.objects_to_create["vlans"], batch_size=BULK_BATCH_SIZE)
             else:
                 self.job.log_info(message="Performing creation of VLANs in Nautobot")
                 try:
@@ -254,7 +281,7 @@ class NautobotAdapter(DiffSync):
         if len(self.objects_to_create["prefixes"]) > 0:
             if self.job.kwargs["bulk_import"]:
                 self.job.log_info(message="Performing bulk create of Prefixes in Nautobot")
-                Prefix.objects.bulk_create(self.objects_to_create["prefixes"], batch_size=50)
+                Prefix.objects.bulk_create(self.objects_to_create["prefixes"], batch_size=BULK_BATCH_SIZE)
             else:
                 self.job.log_info(message="Performing creation of Prefixes in Nautobot")
                 try:
@@ -265,7 +292,7 @@ class NautobotAdapter(DiffSync):
         if len(self.objects_to_create["clusters"]) > 0:
             if self.job.kwargs["bulk_import"]:
                 self.job.log_info(message="Performing bulk create of Virtual Chassis in Nautobot")
-                VirtualChassis.objects.bulk_create(self.objects_to_create["clusters"], batch_size=50)
+                VirtualChassis.objects.bulk_create(self.objects_to_create["clusters"], batch_size=BULK_BATCH_SIZE)
             else:
                 self.job.log_info(message="Performing creation of Virtual Chassis in Nautobot")
                 try:
@@ -276,7 +303,7 @@ class NautobotAdapter(DiffSync):
         if len(self.objects_to_create["devices"]) > 0:
             if self.job.kwargs["bulk_import"]:
                 self.job.log_info(message="Performing bulk create of Devices in Nautobot")
-                Device.objects.bulk_create(self.objects_to_create["devices"], batch_size=50)
+                Device.objects.bulk_create(self.objects_to_create["devices"], batch_size=BULK_BATCH_SIZE)
             else:
                 self.job.log_info(message="Performing creation of Devices in Nautobot")
                 try:
@@ -289,7 +316,7 @@ class NautobotAdapter(DiffSync):
         if len(self.objects_to_create["ports"]) > 0:
             if self.job.kwargs["bulk_import"]:
                 self.job.log_info(message="Performing bulk create of Interfaces in Nautobot")
-                Interface.objects.bulk_create(self.objects_to_create["ports"], batch_size=50)
+                Interface.objects.bulk_create(self.objects_to_create["ports"], batch_size=BULK_BATCH_SIZE)
             else:
                 self.job.log_info(message="Performing creation of Interfaces in Nautobot")
                 try:
@@ -302,7 +329,7 @@ class NautobotAdapter(DiffSync):
         if len(self.objects_to_create["rear_ports"]) > 0:
             if self.job.kwargs["bulk_import"]:
                 self.job.log_info(message="Performing bulk create of Rear Ports in Nautobot")
-                RearPort.objects.bulk_create(self.objects_to_create["rear_ports"], batch_size=50)
+                RearPort.objects.bulk_create(self.objects_to_create["rear_ports"], batch_size=BULK_BATCH_SIZE)
             else:
                 self.job.log_info(message="Performing creation of Rear Ports in Nautobot")
                 try:
@@ -313,7 +340,7 @@ class NautobotAdapter(DiffSync):
         if len(self.objects_to_create["front_ports"]) > 0:
             if self.job.kwargs["bulk_import"]:
                 self.job.log_info(message="Performing bulk create of Front Ports in Nautobot")
-                FrontPort.objects.bulk_create(self.objects_to_create["front_ports"], batch_size=50)
+                FrontPort.objects.bulk_create(self.objects_to_create["front_ports"], batch_size=BULK_BATCH_SIZE)
             else:
                 self.job.log_info(message="Performing creation of Front Ports in Nautobot")
                 try:
@@ -324,7 +351,7 @@ class NautobotAdapter(DiffSync):
         if len(self.objects_to_create["ipaddrs"]) > 0:
             if self.job.kwargs["bulk_import"]:
                 self.job.log_info(message="Performing bulk create of IP Addresses in Nautobot")
-                IPAddress.objects.bulk_create(self.objects_to_create["ipaddrs"], batch_size=50)
+                IPAddress.objects.bulk_create(self.objects_to_create["ipaddrs"], batch_size=BULK_BATCH_SIZE)
             else:
                 self.job.log_info(message="Performing creation of IP Addresses in Nautobot")
                 try:
@@ -335,7 +362,7 @@ class NautobotAdapter(DiffSync):
         if len(self.objects_to_create["providers"]) > 0:
             if self.job.kwargs["bulk_import"]:
                 self.job.log_info(message="Performing bulk create of Providers in Nautobot")
-                Provider.objects.bulk_create(self.objects_to_create["providers"], batch_size=50)
+                Provider.objects.bulk_create(self.objects_to_create["providers"], batch_size=BULK_BATCH_SIZE)
             else:
                 self.job.log_info(message="Performing creation of Providers in Nautobot")
                 try:
@@ -346,7 +373,7 @@ class NautobotAdapter(DiffSync):
         if len(self.objects_to_create["circuits"]) > 0:
             if self.job.kwargs["bulk_import"]:
                 self.job.log_info(message="Performing bulk create of Circuits in Nautobot")
-                Circuit.objects.bulk_create(self.objects_to_create["circuits"], batch_size=50)
+                Circuit.objects.bulk_create(self.objects_to_create["circuits"], batch_size=BULK_BATCH_SIZE)
             else:
                 self.job.log_info(message="Performing creation of Circuits in Nautobot")
                 try:
@@ -357,24 +384,29 @@ class NautobotAdapter(DiffSync):
 
         # if len(self.objects_to_create["cables"]) > 0:
         #     self.job.log_info(message="Performing bulk create of Cables in Nautobot")
-        #     Cable.objects.bulk_create(self.objects_to_create["cables"], batch_size=50)
+        #     Cable.objects.bulk_create(self.objects_to_create["cables"], batch_size=BULK_BATCH_SIZE)
 
         if len(self.objects_to_create["device_primary_ip"]) > 0:
             if self.job.kwargs["bulk_import"]:
                 self.job.log_info(message="Performing bulk update of device management IP addresses in Nautobot.")
                 device_primary_ip4_objs = []
                 device_primary_ip6_objs = []
+                # fetch all Devices and IPAddresses up front instead of two queries per assignment
+                _devices = Device.objects.in_bulk([d[0] for d in self.objects_to_create["device_primary_ip"]])
+                _ipaddrs = IPAddress.objects.in_bulk([d[1] for d in self.objects_to_create["device_primary_ip"]])
                 for d in self.objects_to_create["device_primary_ip"]:
-                    dev = Device.objects.get(id=d[0])
-                    ipaddr = IPAddress.objects.get(id=d[1])
+                    dev, ipaddr = _devices.get(d[0]), _ipaddrs.get(d[1])
+                    if not dev or not ipaddr:
+                        self.job.log_warning(message=f"Unable to find Device {d[0]} or IP Address {d[1]}.")
+                        continue
                     if ipaddr.family == 4:
                         dev.primary_ip4_id = d[1]
                         device_primary_ip4_objs.append(dev)
                     else:
                         dev.primary_ip6_id = d[1]
                         device_primary_ip6_objs.append(dev)
-                Device.objects.bulk_update(device_primary_ip4_objs, ["primary_ip4_id"], batch_size=50)
-                Device.objects.bulk_update(device_primary_ip6_objs, ["primary_ip6_id"], batch_size=50)
+                Device.objects.bulk_update(device_primary_ip4_objs, ["primary_ip4_id"], batch_size=BULK_BATCH_SIZE)
+                Device.objects.bulk_update(device_primary_ip6_objs, ["primary_ip6_id"], batch_size=BULK_BATCH_SIZE)
             else:
                 self.job.log_info(message="Performing assignment of device management IP addresses in Nautobot")
                 for dev_ip in self.objects_to_create["device_primary_ip"]:
@@ -420,14 +452,13 @@ class NautobotAdapter(DiffSync):
                 else:
                     new_vc.validated_save()
             if self.job.kwargs["bulk_import"]:
-                VirtualChassis.objects.bulk_update(master_devices, ["master"], batch_size=50)
+                VirtualChassis.objects.bulk_update(master_devices, ["master"], batch_size=BULK_BATCH_SIZE)
 
         if len(self.objects_to_create["tagged_vlans"]) > 0:
             self.job.log_info(message="Assigning tagged VLANs to Ports in Nautobot.")
             for item in self.objects_to_create["tagged_vlans"]:
                 port, tagged_vlans = item
                 port.tagged_vlans.set(tagged_vlans)
-                port.validated_save()
 
         if LIFECYCLE_MGMT:
             if len(self.objects_to_create["softwarelcms"]) > 0:
@@ -435,7 +466,7 @@ class NautobotAdapter(DiffSync):
                     self.job.log_info(
                         message="Performing bulk creation of Software Versions in Device Lifecycle plugin."
                     )
-                    SoftwareLCM.objects.bulk_create(self.objects_to_create["softwarelcms"], batch_size=50)
+                    SoftwareLCM.objects.bulk_create(self.objects_to_create["softwarelcms"], batch_size=BULK_BATCH_SIZE)
                 else:
                     self.job.log_info(message="Performing creation of Software Versions in Device Lifecycle plugin.")
                     try:
@@ -447,7 +478,7 @@ class NautobotAdapter(DiffSync):
                 if self.job.kwargs["bulk_import"]:
                     self.job.log_info(message="Creating Relationships between Devices and Software Versions.")
                     RelationshipAssociation.objects.bulk_create(
-                        self.objects_to_create["relationshipasscs"], batch_size=50
+                        self.objects_to_create["relationshipasscs"], batch_size=BULK_BATCH_SIZE
                     )
                 else:
                     self.job.log_info(
@@ -460,7 +491,6 @@ class NautobotAdapter(DiffSync):
                         self.job.log_warning(
                             message=f"Error with creating relationships between device and software version. {err}"
                         )
-        return super().sync_complete(source, *args, **kwargs)
 
     def load_sites(self):
         """Add Nautobot Site objects as DiffSync Building models."""
@@ -492,13 +522,13 @@ class NautobotAdapter(DiffSync):
             self.room_map[_rg.site.slug][_rg.slug] = _rg.id
             room = self.room(
                 name=_rg.name,
-                building=Site.objects.get(name=_rg.site).name,
+                building=_rg.site.name,
                 notes=_rg.description,
                 custom_fields=nautobot.get_custom_field_dict(_rg.get_custom_fields()),
                 uuid=_rg.id,
             )
             self.add(room)
-            _site = self.get(self.building, Site.objects.get(name=_rg.site).name)
+            _site = self.get(self.building, _rg.site.name)
             _site.add_child(child=room)
 
     def load_racks(self):
@@ -575,11 +605,18 @@ class NautobotAdapter(DiffSync):
     def load_devices(self):
         """Add Nautobot Device objects as DiffSync Device models."""
         for dev in Device.objects.select_related(
-            "status", "device_type", "device_role", "site", "rack", "platform", "vc_master_for", "virtual_chassis"
+            "status",
+            "device_type__manufacturer",
+            "device_role",
+            "site",
+            "rack__group",
+            "platform",
+            "vc_master_for",
+            "virtual_chassis",
         ).all():
             self.device_map[dev.name] = dev.id
             # As patch panels are added as Devices, we need to filter them out for their own load method.
-            if DeviceRole.objects.get(id=dev.device_role.id).name == "patch panel":
+            if dev.device_role.name == "patch panel":
                 patch_panel = self.patchpanel(
                     name=dev.name,
                     in_service=bool(str(dev.status.name) == "Active"),
@@ -588,7 +625,7 @@ class NautobotAdapter(DiffSync):
                     size=dev.device_type.u_height,
                     position=dev.position,
                     orientation=dev.face if dev.face else "rear",
-                    num_ports=len(FrontPort.objects.filter(device__name=dev.name)),
+                    num_ports=FrontPort.objects.filter(device_id=dev.id).count(),
                     building=dev.site.slug,
                     room=dev.rack.group.name if dev.rack else None,
                     rack=dev.rack.name if dev.rack else None,
@@ -635,7 +672,7 @@ class NautobotAdapter(DiffSync):
 
     def load_interfaces(self):
         """Add Nautobot Interface objects as DiffSync Port models."""
-        for port in Interface.objects.select_related("device", "status").all():
+        for port in Interface.objects.select_related("device", "status").iterator(chunk_size=2000):
             if port.device.name not in self.port_map:
                 self.port_map[port.device.name] = {}
             if port.name not in self.port_map[port.device.name]:
@@ -718,7 +755,7 @@ class NautobotAdapter(DiffSync):
 
     def load_ip_addresses(self):
         """Add Nautobot IPAddress objects as DiffSync IPAddress models."""
-        for _ip in IPAddress.objects.select_related("status", "vrf").all():
+        for _ip in IPAddress.objects.select_related("status", "vrf").iterator(chunk_size=2000):
             if _ip.vrf:
                 vrf_name = _ip.vrf.name
             else:
@@ -945,33 +982,31 @@ class NautobotAdapter(DiffSync):
 
     def load_front_ports(self):
         """Add Nautobot FrontPort objects as DiffSync PatchPanelFrontPort models."""
-        for port in FrontPort.objects.select_related("device").all():
-            if port.device.device_role.name == "patch panel":
-                if port.device.name not in self.fp_map:
-                    self.fp_map[port.device.name] = {}
-                self.fp_map[port.device.name][port.name] = port.id
-                front_port = self.patchpanelfrontport(
-                    name=port.name,
-                    patchpanel=port.device.name,
-                    port_type=port.type,
-                    uuid=port.id,
-                )
-                self.add(front_port)
+        for port in FrontPort.objects.filter(device__device_role__name="patch panel").select_related("device"):
+            if port.device.name not in self.fp_map:
+                self.fp_map[port.device.name] = {}
+            self.fp_map[port.device.name][port.name] = port.id
+            front_port = self.patchpanelfrontport(
+                name=port.name,
+                patchpanel=port.device.name,
+                port_type=port.type,
+                uuid=port.id,
+            )
+            self.add(front_port)
 
     def load_rear_ports(self):
         """Add Nautobot RearPort objects as DiffSync PatchPanelRearPort models."""
-        for port in RearPort.objects.select_related("device").all():
-            if port.device.device_role.name == "patch panel":
-                if port.device.name not in self.rp_map:
-                    self.rp_map[port.device.name] = {}
-                self.rp_map[port.device.name][port.name] = port.id
-                rear_port = self.patchpanelrearport(
-                    name=port.name,
-                    patchpanel=port.device.name,
-                    port_type=port.type,
-                    uuid=port.id,
-                )
-                self.add(rear_port)
+        for port in RearPort.objects.filter(device__device_role__name="patch panel").select_related("device"):
+            if port.device.name not in self.rp_map:
+                self.rp_map[port.device.name] = {}
+            self.rp_map[port.device.name][port.name] = port.id
+            rear_port = self.patchpanelrearport(
+                name=port.name,
+                patchpanel=port.device.name,
+                port_type=port.type,
+                uuid=port.id,
+            )
+            self.add(rear_port)
 
     def load(self):
         """Load data from Nautobot."""
@@ -4,6 +4,7 @@ from typing import List, Optional
 from uuid import UUID
 
 from diffsync import DiffSyncModel
+from pydantic import Field
 
 
 class Building(DiffSyncModel):
@@ -19,7 +20,7 @@ class Building(DiffSyncModel):
     longitude: Optional[float]
     contact_name: Optional[str]
     contact_phone: Optional[str]
-    rooms: List["Room"] = list()
+    rooms: List["Room"] = Field(default_factory=list)
     tags: Optional[List[str]]
     custom_fields: Optional[dict]
     uuid: Optional[UUID]
@@ -35,7 +36,7 @@ class Room(DiffSyncModel):
     name: str
     building: str
     notes: Optional[str]
-    racks: List["Rack"] = list()
+    racks: List["Rack"] = Field(default_factory=list)
     custom_fields: Optional[dict]
     uuid: Optional[UUID]
 
@@ -132,7 +133,7 @@ class Device(DiffSyncModel):
     os: Optional[str]
     os_version: Optional[str]
     in_service: Optional[bool]
-    interfaces: Optional[List["Port"]] = []
+    interfaces: Optional[List["Port"]] = Field(default_factory=list)
     serial_no: Optional[str]
     tags: Optional[List[str]]
     cluster_host: Optional[str]
@@ -170,7 +171,7 @@ class Port(DiffSyncModel):
     tags: Optional[List[str]]
     mode: str
     status: str
-    vlans: Optional[List[int]] = []
+    vlans: Optional[List[int]] = Field(default_factory=list)
     custom_fields: Optional[dict]
     uuid: Optional[UUID]
 
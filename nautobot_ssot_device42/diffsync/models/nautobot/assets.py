@@ -1,7 +1,6 @@
 """DiffSyncModel Asset subclasses for Nautobot Device42 data sync."""
 
 from django.core.exceptions import ValidationError
-from django.utils.text import slugify
 from nautobot.dcim.models import Device, DeviceType, FrontPort, RearPort
 from nautobot_ssot_device42.constant import PLUGIN_CFG
 from nautobot_ssot_device42.diffsync.models.base.assets import PatchPanel, PatchPanelRearPort, PatchPanelFrontPort
@@ -14,11 +13,11 @@ def find_site(diffsync, attrs):
     pp_site = False
     try:
         if attrs.get("building"):
-            pp_site = diffsync.site_map[slugify(attrs["building"])]
+            pp_site = diffsync.site_map[nautobot.get_slug(attrs["building"])]
         elif attrs.get("room") and attrs.get("rack"):
             rack = diffsync.get(NautobotRack, {"name": attrs["rack"], "group": attrs["room"]})
             site_name = rack.building
-            pp_site = diffsync.site_map[slugify(site_name)]
+            pp_site = diffsync.site_map[nautobot.get_slug(site_name)]
     except KeyError:
         if diffsync.job.kwargs.get("debug"):
             diffsync.job.log_warning(message=f"Unable to find Site {attrs.get('building')}.")
@@ -33,7 +32,7 @@ class NautobotPatchPanel(PatchPanel):
         pp_rack = False
         try:
             if building is not None and room is not None and rack is not None:
-                pp_rack = diffsync.rack_map[slugify(building)][slugify(room)][rack]
+                pp_rack = diffsync.rack_map[nautobot.get_slug(building)][nautobot.get_slug(room)][rack]
             elif rack is not None:
                 for new_rack in diffsync.objects_to_create["racks"]:
                     if new_rack.name is rack:
@@ -63,7 +62,7 @@ class NautobotPatchPanel(PatchPanel):
                 name=ids["name"],
                 status_id=pp_status,
                 site_id=pp_site,
-                device_type_id=diffsync.devicetype_map[slugify(attrs["model"])],
+                device_type_id=diffsync.devicetype_map[nautobot.get_slug(attrs["model"])],
                 device_role_id=pp_role,
                 serial=attrs["serial_no"],
             )
@@ -90,7 +89,7 @@ class NautobotPatchPanel(PatchPanel):
             else:
                 ppanel.status_id = self.diffsync.status_map["offline"]
         if "vendor" in attrs and "model" in attrs:
-            ppanel.device_type = DeviceType.objects.get(model=attrs["model"])
+            ppanel.device_type_id = DeviceType.objects.values_list("id", flat=True).get(model=attrs["model"])
         if "orientation" in attrs:
             ppanel.face = attrs["orientation"]
         if "position" in attrs:
@@ -135,8 +134,7 @@ class NautobotPatchPanel(PatchPanel):
         if PLUGIN_CFG.get("delete_on_sync"):
             super().delete()
             self.diffsync.job.log_info(message=f"Patch panel {self.name} will be deleted.")
-            _pp = Device.objects.get(id=self.uuid)
-            self.diffsync.objects_to_delete["patchpanel"].append(_pp)  # pylint: disable=protected-access
+            self.diffsync.objects_to_delete["patchpanel"].add(self.uuid)  # pylint: disable=protected-access
         return self
 
 
@@ -185,8 +183,7 @@ class NautobotPatchPanelRearPort(PatchPanelRearPort):
         if PLUGIN_CFG.get("delete_on_sync"):
             super().delete()
             self.diffsync.job.log_info(message=f"RearPort {self.name} for {self.patchpanel} will be deleted.")
-            port = RearPort.objects.get(id=self.uuid)
-            port.delete()
+            RearPort.objects.filter(id=self.uuid).delete()
         return self
 
 
@@ -214,7 +211,8 @@ class NautobotPatchPanelFrontPort(PatchPanelFrontPort):
                 diffsync.fp_map[ids["patchpanel"]][ids["name"]] = front_port.id
                 return super().create(ids=ids, diffsync=diffsync, attrs=attrs)
             except ValidationError as err:
-                diffsync.job.log_debug(message=f"Unable to create patch panel front port {ids['name']}. {err}")
+                if diffsync.job.kwargs.get("debug"):
+                    diffsync.job.log_debug(message=f"Unable to create patch panel front port {ids['name']}. {err}")
                 return None
 
     def update(self, attrs):
@@ -235,6 +233,5 @@ class NautobotPatchPanelFrontPort(PatchPanelFrontPort):
         if PLUGIN_CFG.get("delete_on_sync"):
             super().delete()
             self.diffsync.job.log_info(message=f"FrontPort {self.name} for {self.patchpanel} will be deleted.")
-            port = FrontPort.objects.get(id=self.uuid)
-            port.delete()
+            FrontPort.objects.filter(id=self.uuid).delete()
         return self
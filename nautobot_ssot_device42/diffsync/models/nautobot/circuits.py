@@ -2,12 +2,11 @@
 
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
-from django.utils.text import slugify
 from nautobot.circuits.models import Circuit as OrmCircuit
 from nautobot.circuits.models import CircuitTermination as OrmCT
 from nautobot.circuits.models import Provider as OrmProvider
 from nautobot.dcim.models import Cable as OrmCable
-from nautobot.extras.models import Status as OrmStatus
+from nautobot.dcim.models import Interface as OrmInterface
 from nautobot_ssot_device42.constant import INTF_SPEED_MAP, PLUGIN_CFG
 from nautobot_ssot_device42.diffsync.models.base.circuits import Circuit, Provider
 from nautobot_ssot_device42.diffsync.models.nautobot.dcim import NautobotDevice
@@ -21,12 +20,13 @@ class NautobotProvider(Provider):
     def create(cls, diffsync, ids, attrs):
         """Create Provider object in Nautobot."""
         diffsync.job.log_info(message=f"Creating Provider {ids['name']}.")
+        _slug = nautobot.get_slug(ids["name"])
         try:
-            _provider = diffsync.provider_map[slugify(ids["name"])]
+            _provider = diffsync.provider_map[_slug]
         except KeyError:
             _provider = OrmProvider(
                 name=ids["name"],
-                slug=slugify(ids["name"]),
+                slug=_slug,
                 account=attrs["vendor_acct"] if attrs.get("vendor_acct") else "",
                 portal_url=attrs["vendor_url"] if attrs.get("vendor_url") else "",
                 noc_contact=attrs["vendor_contact1"] if attrs.get("vendor_contact1") else "",
@@ -34,11 +34,10 @@ class NautobotProvider(Provider):
                 comments=attrs["notes"] if attrs.get("notes") else "",
             )
             if attrs.get("tags"):
-                for _tag in nautobot.get_tags(attrs["tags"]):
-                    _provider.tags.add(_tag)
+                _provider.tags.add(*nautobot.get_tags(attrs["tags"]))
             try:
                 diffsync.objects_to_create["providers"].append(_provider)
-                diffsync.provider_map[slugify(ids["name"])] = _provider.id
+                diffsync.provider_map[_slug] = _provider.id
                 return super().create(ids=ids, diffsync=diffsync, attrs=attrs)
             except ValidationError as err:
                 if diffsync.job.kwargs.get("debug"):
@@ -74,8 +73,7 @@ class NautobotProvider(Provider):
         if PLUGIN_CFG.get("delete_on_sync"):
             self.diffsync.job.log_info(message=f"Provider {self.name} will be deleted.")
             super().delete()
-            provider = OrmProvider.objects.get(id=self.uuid)
-            self.diffsync.objects_to_delete["provider"].append(provider)  # pylint: disable=protected-access
+            self.diffsync.objects_to_delete["provider"].add(self.uuid)  # pylint: disable=protected-access
         return self
 
 
@@ -91,16 +89,15 @@ class NautobotCircuit(Circuit):
         except KeyError:
             _circuit = OrmCircuit(
                 cid=ids["circuit_id"],
-                provider_id=diffsync.provider_map[slugify(ids["provider"])],
+                provider_id=diffsync.provider_map[nautobot.get_slug(ids["provider"])],
                 type=nautobot.verify_circuit_type(attrs["type"]),
-                status_id=diffsync.status_map[slugify(attrs["status"])],
+                status_id=diffsync.status_map[nautobot.get_slug(attrs["status"])],
                 install_date=attrs["install_date"] if attrs.get("install_date") else None,
                 commit_rate=attrs["bandwidth"] if attrs.get("bandwidth") else None,
                 comments=attrs["notes"] if attrs.get("notes") else "",
             )
             if attrs.get("tags"):
-                for _tag in nautobot.get_tags(attrs["tags"]):
-                    _circuit.tags.add(_tag)
+                _circuit.tags.add(*nautobot.get_tags(attrs["tags"]))
             diffsync.objects_to_create["circuits"].append(_circuit)
             if attrs.get("origin_int") and attrs.get("origin_dev"):
                 if attrs["origin_dev"] not in diffsync.circuit_map:
@@ -135,7 +132,7 @@ class NautobotCircuit(Circuit):
         if "type" in attrs:
             _circuit.type = nautobot.verify_circuit_type(attrs["type"])
         if "status" in attrs:
-            _circuit.status = OrmStatus.objects.get(name=attrs["status"])
+            _circuit.status_id = self.diffsync.status_map[nautobot.get_slug(attrs["status"])]
         if "install_date" in attrs:
             _circuit.install_date = attrs["install_date"]
         if "bandwidth" in attrs:
@@ -178,7 +175,7 @@ class NautobotCircuit(Circuit):
                 _term = diffsync.circuit_map[dev][intf]
             except KeyError:
                 _site = diffsync.get(NautobotDevice, dev)
-                _site = diffsync.site_map[slugify(_site.name)]
+                _site = diffsync.site_map[nautobot.get_slug(_site.name)]
                 _term = OrmCT(
                     circuit_id=circuit,
                     term_side=term_side,
@@ -188,9 +185,9 @@ class NautobotCircuit(Circuit):
                 diffsync.objects_to_create["circuits"].append(_term)
             if _intf and _term:
                 new_cable = OrmCable(
-                    termination_a_type=ContentType.objects.get(app_label="dcim", model="interface"),
+                    termination_a_type=ContentType.objects.get_for_model(OrmInterface),
                     termination_a_id=_intf,
-                    termination_b_type=ContentType.objects.get(app_label="circuits", model="circuittermination"),
+                    termination_b_type=ContentType.objects.get_for_model(OrmCT),
                     termination_b_id=_term,
                     status_id=diffsync.status_map["connected"],
                     color=nautobot.get_random_color(),
@@ -212,6 +209,5 @@ class NautobotCircuit(Circuit):
         if PLUGIN_CFG.get("delete_on_sync"):
             self.diffsync.job.log_info(message=f"Circuit {self.circuit_id} will be deleted.")
             super().delete()
-            circuit = OrmCircuit.objects.get(id=self.uuid)
-            self.diffsync.objects_to_delete["circuit"].append(circuit)  # pylint: disable=protected-access
+            self.diffsync.objects_to_delete["circuit"].add(self.uuid)  # pylint: disable=protected-access
         return self
@@ -6,9 +6,7 @@ from uuid import UUID
 
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
-from django.utils.text import slugify
 from nautobot.circuits.models import CircuitTermination as OrmCT
-from nautobot.core.settings_funcs import is_truthy
 from nautobot.dcim.models import Cable as OrmCable
 from nautobot.dcim.models import Device as OrmDevice
 from nautobot.dcim.models import DeviceType as OrmDeviceType
@@ -20,7 +18,6 @@ from nautobot.dcim.models import RackGroup as OrmRackGroup
 from nautobot.dcim.models import Site as OrmSite
 from nautobot.dcim.models import VirtualChassis as OrmVC
 from nautobot.extras.models import RelationshipAssociation
-from nautobot.extras.models import Status as OrmStatus
 from nautobot_ssot_device42.constant import DEFAULTS, INTF_SPEED_MAP, PLUGIN_CFG
 from nautobot_ssot_device42.diffsync.models.base.dcim import (
     Building,
@@ -44,6 +41,11 @@ except ImportError:
     LIFECYCLE_MGMT = False
 
 
+def _dec6(value):
+    """Round a coordinate to the 6 decimal places Site latitude/longitude are stored with."""
+    return round(Decimal(value if value else 0.0), 6)
+
+
 class NautobotBuilding(Building):
     """Nautobot Building model."""
 
@@ -51,27 +53,28 @@ class NautobotBuilding(Building):
     def create(cls, diffsync, ids, attrs):
         """Create Site object in Nautobot."""
         diffsync.job.log_info(message=f"Creating Site {ids['name']}.")
-        def_site_status = diffsync.status_map[slugify(DEFAULTS.get("site_status"))]
+        def_site_status = diffsync.status_map[nautobot.get_slug(DEFAULTS.get("site_status"))]
+        _slug = nautobot.get_slug(ids["name"])
         new_site = OrmSite(
             name=ids["name"],
-            slug=slugify(ids["name"]),
+            slug=_slug,
             status_id=def_site_status,
-            physical_address=attrs["address"] if attrs.get("address") else "",
-            latitude=round(Decimal(attrs["latitude"] if attrs["latitude"] else 0.0), 6),
-            longitude=round(Decimal(attrs["longitude"] if attrs["longitude"] else 0.0), 6),
-            contact_name=attrs["contact_name"] if attrs.get("contact_name") else "",
-            contact_phone=attrs["contact_phone"] if attrs.get("contact_phone") else "",
+            physical_address=attrs.get("address") or "",
+            latitude=_dec6(attrs["latitude"]),
+            longitude=_dec6(attrs["longitude"]),
+            contact_name=attrs.get("contact_name") or "",
+            contact_phone=attrs.get("contact_phone") or "",
         )
-        if attrs.get("tags"):
-            for _tag in nautobot.get_tags(attrs["tags"]):
-                new_site.tags.add(_tag)
-            _facility = device42.get_facility(tags=attrs["tags"], diffsync=diffsync)
+        _tags = attrs.get("tags")
+        if _tags:
+            new_site.tags.add(*nautobot.get_tags(_tags))
+            _facility = device42.get_facility(tags=_tags, diffsync=diffsync)
             if _facility:
                 new_site.facility = _facility.upper()
         if attrs.get("custom_fields"):
             nautobot.update_custom_fields(new_cfields=attrs["custom_fields"], update_obj=new_site)
         diffsync.objects_to_create["sites"].append(new_site)
-        diffsync.site_map[slugify(ids["name"])] = new_site.id
+        diffsync.site_map[_slug] = new_site.id
         return super().create(ids=ids, diffsync=diffsync, attrs=attrs)
 
     def update(self, attrs):
@@ -81,9 +84,9 @@ class NautobotBuilding(Building):
         if "address" in attrs:
             _site.physical_address = attrs["address"]
         if "latitude" in attrs:
-            _site.latitude = round(Decimal(attrs["latitude"]), 6)
+            _site.latitude = _dec6(attrs["latitude"])
         if "longitude" in attrs:
-            _site.longitude = round(Decimal(attrs["longitude"]), 6)
+            _site.longitude = _dec6(attrs["longitude"])
         if "contact_name" in attrs:
             _site.contact_name = attrs["contact_name"]
         if "contact_phone" in attrs:
@@ -111,8 +114,7 @@ class NautobotBuilding(Building):
         if PLUGIN_CFG.get("delete_on_sync"):
             super().delete()
             self.diffsync.job.log_info(message=f"Site {self.name} will be deleted.")
-            site = OrmSite.objects.get(id=self.uuid)
-            self.diffsync.objects_to_delete["site"].append(site)  # pylint: disable=protected-access
+            self.diffsync.objects_to_delete["site"].add(self.uuid)  # pylint: disable=protected-access
         return self
 
 
@@ -123,18 +125,20 @@ class NautobotRoom(Room):
     def create(cls, diffsync, ids, attrs):
         """Create RackGroup object in Nautobot."""
         diffsync.job.log_info(message=f"Creating RackGroup {ids['name']}.")
+        _slug = nautobot.get_slug(ids["name"])
+        _site_slug = nautobot.get_slug(ids["building"])
         new_rg = OrmRackGroup(
             name=ids["name"],
-            slug=slugify(ids["name"]),
-            site_id=diffsync.site_map[slugify(ids["building"])],
-            description=attrs["notes"] if attrs.get("notes") else "",
+            slug=_slug,
+            site_id=diffsync.site_map[_site_slug],
+            description=attrs.get("notes") or "",
         )
         if attrs.get("custom_fields"):
             nautobot.update_custom_fields(new_cfields=attrs["custom_fields"], update_obj=new_rg)
         diffsync.objects_to_create["rooms"].append(new_rg)
-        if slugify(ids["building"]) not in diffsync.room_map:
-            diffsync.room_map[slugify(ids["building"])] = {}
-        diffsync.room_map[slugify(ids["building"])][slugify(ids["name"])] = new_rg.id
+        if _site_slug not in diffsync.room_map:
+            diffsync.room_map[_site_slug] = {}
+        diffsync.room_map[_site_slug][_slug] = new_rg.id
         return super().create(ids=ids, diffsync=diffsync, attrs=attrs)
 
     def update(self, attrs):
@@ -153,8 +157,7 @@ class NautobotRoom(Room):
         if PLUGIN_CFG.get("delete_on_sync"):
             super().delete()
             self.diffsync.job.log_info(message=f"RackGroup {self.name} will be deleted.")
-            rackgroup = OrmRackGroup.objects.get(id=self.uuid)
-            rackgroup.delete()
+            OrmRackGroup.objects.filter(id=self.uuid).delete()
         return self
 
 
@@ -165,27 +168,28 @@ class NautobotRack(Rack):
     def create(cls, diffsync, ids, attrs):
         """Create Rack object in Nautobot."""
         diffsync.job.log_info(message=f"Creating Rack {ids['name']}.")
-        _site = diffsync.site_map[slugify(ids["building"])]
-        _rg = diffsync.room_map[slugify(ids["building"])][slugify(ids["room"])]
+        _site_slug = nautobot.get_slug(ids["building"])
+        _room_slug = nautobot.get_slug(ids["room"])
+        _site = diffsync.site_map[_site_slug]
+        _rg = diffsync.room_map[_site_slug][_room_slug]
         new_rack = OrmRack(
             name=ids["name"],
             site_id=_site,
             group_id=_rg,
-            status_id=diffsync.status_map[slugify(DEFAULTS.get("rack_status"))],
-            u_height=attrs["height"] if attrs.get("height") else 1,
-            desc_units=not (is_truthy(attrs["numbering_start_from_bottom"])),
+            status_id=diffsync.status_map[nautobot.get_slug(DEFAULTS.get("rack_status"))],
+            u_height=attrs.get("height") or 1,
+            desc_units=not (nautobot.is_truthy_cached(attrs["numbering_start_from_bottom"])),
         )
         if attrs.get("tags"):
-            for _tag in nautobot.get_tags(attrs["tags"]):
-                new_rack.tags.add(_tag)
+            new_rack.tags.add(*nautobot.get_tags(attrs["tags"]))
         if attrs.get("custom_fields"):
             nautobot.update_custom_fields(new_cfields=attrs["custom_fields"], update_obj=new_rack)
         diffsync.objects_to_create["racks"].append(new_rack)
-        if slugify(ids["building"]) not in diffsync.rack_map:
-            diffsync.rack_map[slugify(ids["building"])] = {}
-        if slugify(ids["room"]) not in diffsync.rack_map[slugify(ids["building"])]:
-            diffsync.rack_map[slugify(ids["building"])][slugify(ids["room"])] = {}
-        diffsync.rack_map[slugify(ids["building"])][slugify(ids["room"])][ids["name"]] = new_rack.id
+        if _site_slug not in diffsync.rack_map:
+            diffsync.rack_map[_site_slug] = {}
+        if _room_slug not in diffsync.rack_map[_site_slug]:
+            diffsync.rack_map[_site_slug][_room_slug] = {}
+        diffsync.rack_map[_site_slug][_room_slug][ids["name"]] = new_rack.id
         return super().create(ids=ids, diffsync=diffsync, attrs=attrs)
 
     def update(self, attrs):
@@ -195,7 +199,7 @@ class NautobotRack(Rack):
         if "height" in attrs:
             _rack.u_height = attrs["height"]
         if "numbering_start_from_bottom" in attrs:
-            _rack.desc_units = not (is_truthy(attrs["numbering_start_from_bottom"]))
+            _rack.desc_units = not (nautobot.is_truthy_cached(attrs["numbering_start_from_bottom"]))
         if "tags" in attrs:
             if attrs.get("tags"):
                 nautobot.update_tags(tagged_obj=_rack, new_tags=attrs["tags"])
@@ -216,8 +220,7 @@ class NautobotRack(Rack):
         if PLUGIN_CFG.get("delete_on_sync"):
             super().delete()
             self.diffsync.job.log_info(message=f"Rack {self.name} will be deleted.")
-            rack = OrmRack.objects.get(id=self.uuid)
-            self.diffsync.objects_to_delete["rack"].append(rack)  # pylint: disable=protected-access
+            self.diffsync.objects_to_delete["rack"].add(self.uuid)  # pylint: disable=protected-access
         return self
 
 
@@ -228,17 +231,18 @@ class NautobotVendor(Vendor):
     def create(cls, diffsync, ids, attrs):
         """Create Manufacturer object in Nautobot."""
         diffsync.job.log_info(message=f"Creating Manufacturer {ids['name']}.")
+        _slug = nautobot.get_slug(ids["name"])
         try:
-            diffsync.vendor_map[slugify(ids["name"])]
+            diffsync.vendor_map[_slug]
         except KeyError:
             new_manu = OrmManufacturer(
                 name=ids["name"],
-                slug=slugify(ids["name"]),
+                slug=_slug,
             )
             if attrs.get("custom_fields"):
                 nautobot.update_custom_fields(new_cfields=attrs["custom_fields"], update_obj=new_manu)
             diffsync.objects_to_create["vendors"].append(new_manu)
-            diffsync.vendor_map[slugify(ids["name"])] = new_manu.id
+            diffsync.vendor_map[_slug] = new_manu.id
         return super().create(ids=ids, diffsync=diffsync, attrs=attrs)
 
     def update(self, attrs):
@@ -260,8 +264,7 @@ class NautobotVendor(Vendor):
         if PLUGIN_CFG.get("delete_on_sync"):
             super().delete()
             self.diffsync.job.log_info(message=f"Manufacturer {self.name} will be deleted.")
-            _manu = OrmManufacturer.objects.get(id=self.uuid)
-            self.diffsync.objects_to_delete["manufacturer"].append(_manu)  # pylint: disable=protected-access
+            self.diffsync.objects_to_delete["manufacturer"].add(self.uuid)  # pylint: disable=protected-access
         return self
 
 
@@ -272,29 +275,31 @@ class NautobotHardware(Hardware):
     def create(cls, diffsync, ids, attrs):
         """Create DeviceType object in Nautobot."""
         diffsync.job.log_info(message=f"Creating DeviceType {ids['name']}.")
+        _slug = nautobot.get_slug(ids["name"])
         try:
-            diffsync.devicetype_map[slugify(ids["name"])]
+            diffsync.devicetype_map[_slug]
         except KeyError:
             new_dt = OrmDeviceType(
                 model=ids["name"],
-                slug=slugify(ids["name"]),
-                manufacturer_id=diffsync.vendor_map[slugify(attrs["manufacturer"])],
-                part_number=attrs["part_number"] if attrs.get("part_number") else "",
-                u_height=int(attrs["size"]) if attrs.get("size") else 1,
+                slug=_slug,
+                manufacturer_id=diffsync.vendor_map[nautobot.get_slug(attrs["manufacturer"])],
+                part_number=attrs.get("part_number") or "",
+                u_height=int(attrs.get("size") or 1),
                 is_full_depth=bool(attrs.get("depth") == "Full Depth"),
             )
             if attrs.get("custom_fields"):
                 nautobot.update_custom_fields(new_cfields=attrs["custom_fields"], update_obj=new_dt)
             diffsync.objects_to_create["devicetypes"].append(new_dt)
-            diffsync.devicetype_map[slugify(ids["name"])] = new_dt.id
+            diffsync.devicetype_map[_slug] = new_dt.id
         return super().create(ids=ids, diffsync=diffsync, attrs=attrs)
 
     def update(self, attrs):
         """Update DeviceType object in Nautobot."""
         _dt = OrmDeviceType.objects.get(id=self.uuid)
-        self.diffsync.job.log_debug(message=f"Updating DeviceType {_dt.model}.")
+        if self.diffsync.job.kwargs.get("debug"):
+            self.diffsync.job.log_debug(message=f"Updating DeviceType {_dt.model}.")
         if "manufacturer" in attrs:
-            _dt.manufacturer = OrmManufacturer.objects.get(slug=slugify(attrs["manufacturer"]))
+            _dt.manufacturer_id = self.diffsync.vendor_map[nautobot.get_slug(attrs["manufacturer"])]
         if "part_number" in attrs:
             if attrs["part_number"] is not None:
                 _dt.part_number = attrs["part_number"]
@@ -319,8 +324,7 @@ class NautobotHardware(Hardware):
         if PLUGIN_CFG.get("delete_on_sync"):
             super().delete()
             self.diffsync.job.log_info(message=f"DeviceType {self.name} will be deleted.")
-            _dt = OrmDeviceType.objects.get(id=self.uuid)
-            self.diffsync.objects_to_delete["device_type"].append(_dt)  # pylint: disable=protected-access
+            self.diffsync.objects_to_delete["device_type"].add(self.uuid)  # pylint: disable=protected-access
         return self
 
 
@@ -334,13 +338,13 @@ class NautobotCluster(Cluster):
         As the master node of the VC needs to be a regular Device, we'll create that and then the VC.
         Member devices will be added to VC at Device creation.
         """
-        diffsync.job.log_debug(message=f"Creating VirtualChassis {ids['name']}.")
+        if diffsync.job.kwargs.get("debug"):
+            diffsync.job.log_debug(message=f"Creating VirtualChassis {ids['name']}.")
         new_vc = OrmVC(
             name=ids["name"],
         )
         if attrs.get("tags"):
-            for _tag in nautobot.get_tags(attrs["tags"]):
-                new_vc.tags.add(_tag)
+            new_vc.tags.add(*nautobot.get_tags(attrs["tags"]))
         if attrs.get("custom_fields"):
             nautobot.update_custom_fields(new_cfields=attrs["custom_fields"], update_obj=new_vc)
         diffsync.objects_to_create["clusters"].append(new_vc)
@@ -350,7 +354,8 @@ class NautobotCluster(Cluster):
     def update(self, attrs):
         """Update Virtual Chassis object in Nautobot."""
         _vc = OrmVC.objects.get(id=self.uuid)
-        self.diffsync.job.log_debug(message=f"Updating VirtualChassis {_vc.name}.")
+        if self.diffsync.job.kwargs.get("debug"):
+            self.diffsync.job.log_debug(message=f"Updating VirtualChassis {_vc.name}.")
         if "tags" in attrs:
             if attrs.get("tags"):
                 nautobot.update_tags(tagged_obj=_vc, new_tags=attrs["tags"])
@@ -371,8 +376,7 @@ class NautobotCluster(Cluster):
         if PLUGIN_CFG.get("delete_on_sync"):
             super().delete()
             self.diffsync.job.log_info(message=f"Virtual Chassis {self.name} will be deleted.")
-            _cluster = OrmVC.objects.get(id=self.uuid)
-            self.diffsync.objects_to_delete["cluster"].append(_cluster)  # pylint: disable=protected-access
+            self.diffsync.objects_to_delete["cluster"].add(self.uuid)  # pylint: disable=protected-access
         return self
 
 
@@ -383,7 +387,7 @@ class NautobotDevice(Device):
     def _get_site(diffsync, building: str):
         """Get Site ID from Building name."""
         try:
-            _site = diffsync.site_map[slugify(building)]
+            _site = diffsync.site_map[nautobot.get_slug(building)]
             return _site
         except KeyError:
             if diffsync.job.kwargs.get("debug"):
@@ -398,18 +402,20 @@ class NautobotDevice(Device):
             _status = diffsync.status_map["active"]
         else:
             _status = diffsync.status_map["offline"]
-        if attrs.get("tags") and len(attrs["tags"]) > 0:
+        _tags = attrs.get("tags")
+        if _tags:
             _role = nautobot.verify_device_role(
-                diffsync=diffsync, role_name=device42.find_device_role_from_tags(tag_list=attrs["tags"])
+                diffsync=diffsync, role_name=device42.find_device_role_from_tags(tag_list=_tags)
             )
         else:
             _role = nautobot.verify_device_role(diffsync=diffsync, role_name=DEFAULTS.get("device_role"))
         try:
-            _dt = diffsync.devicetype_map[slugify(attrs["hardware"])]
+            _dt = diffsync.devicetype_map[nautobot.get_slug(attrs["hardware"])]
         except KeyError:
             diffsync.job.log_warning(message=f"Unable to find DeviceType {attrs['hardware']}.")
             return None
-        _site = cls._get_site(diffsync, building=attrs["building"])
+        _site_slug = nautobot.get_slug(attrs["building"])
+        _site = cls._get_site(diffsync, building=_site_slug)
         if not _site:
             diffsync.job.log_warning(message=f"Can't create {ids['name']} as unable to determine Site.")
             return None
@@ -419,30 +425,31 @@ class NautobotDevice(Device):
             site_id=_site,
             device_type_id=_dt,
             device_role_id=_role,
-            serial=attrs["serial_no"] if attrs.get("serial_no") else "",
+            serial=attrs.get("serial_no") or "",
         )
         if attrs.get("rack"):
-            new_device.rack_id = diffsync.rack_map[slugify(attrs["building"])][slugify(attrs["room"])][attrs["rack"]]
-            new_device.position = int(attrs["rack_position"]) if attrs["rack_position"] else None
-            new_device.face = attrs["rack_orientation"] if attrs["rack_orientation"] else "front"
+            try:
+                new_device.rack_id = diffsync.rack_map[_site_slug][nautobot.get_slug(attrs["room"])][attrs["rack"]]
+                new_device.position = int(attrs["rack_position"]) if attrs["rack_position"] else None
+                new_device.face = attrs["rack_orientation"] or "front"
+            except KeyError:
+                diffsync.job.log_warning(
+                    message=f"Unable to find Rack {attrs['rack']} in {attrs['room']} {attrs['building']} for Device {ids['name']}."
+                )
         if attrs.get("os"):
             devicetype = diffsync.get(NautobotHardware, attrs["hardware"])
+            manu_id = diffsync.vendor_map[nautobot.get_slug(devicetype.manufacturer)]
             new_device.platform_id = nautobot.verify_platform(
                 diffsync=diffsync,
                 platform_name=attrs["os"],
-                manu=diffsync.vendor_map[slugify(devicetype.manufacturer)],
+                manu=manu_id,
             )
         if attrs.get("os_version"):
             if LIFECYCLE_MGMT and attrs.get("os"):
-                manu_id = None
-                for dt in diffsync.objects_to_create["devicetypes"]:
-                    if dt.model == attrs["hardware"]:
-                        manu_id = dt.manufacturer_id
-                if manu_id:
-                    soft_lcm = cls._add_software_lcm(
-                        diffsync=diffsync, os=attrs["os"], version=attrs["os_version"], manufacturer=manu_id
-                    )
-                    cls._assign_version_to_device(diffsync=diffsync, device=new_device.id, software_lcm=soft_lcm)
+                soft_lcm = cls._add_software_lcm(
+                    diffsync=diffsync, os=attrs["os"], version=attrs["os_version"], manufacturer=manu_id
+                )
+                cls._assign_version_to_device(diffsync=diffsync, device=new_device.id, software_lcm=soft_lcm)
             else:
                 attrs["custom_fields"].append({"key": "OS Version", "value": attrs["os_version"]})
         if attrs.get("cluster_host"):
@@ -458,9 +465,8 @@ class NautobotDevice(Device):
                 diffsync.job.log_warning(message=f"Unable to find Virtual Chassis {attrs['cluster_host']}")
         if attrs.get("vc_position"):
             new_device.vc_position = attrs["vc_position"]
-        if attrs.get("tags"):
-            for _tag in nautobot.get_tags(attrs["tags"]):
-                new_device.tags.add(_tag)
+        if _tags:
+            new_device.tags.add(*nautobot.get_tags(_tags))
         if attrs.get("custom_fields"):
             nautobot.update_custom_fields(new_cfields=attrs["custom_fields"], update_obj=new_device)
         diffsync.objects_to_create["devices"].append(new_device)
@@ -469,18 +475,17 @@ class NautobotDevice(Device):
 
     def update(self, attrs):
         """Update Device object in Nautobot."""
-        _dev = OrmDevice.objects.get(id=self.uuid)
+        _dev = OrmDevice.objects.select_related("site", "device_role", "device_type").get(id=self.uuid)
         self.diffsync.job.log_info(message=f"Updating Device {self.name} in {_dev.site} with {attrs}")
         if "building" in attrs:
-            site_id = None
-            try:
-                site_id = OrmSite.objects.get(name=attrs["building"])
-            except OrmSite.DoesNotExist:
-                for site in self.diffsync.objects_to_create["sites"]:
-                    if site.slug == attrs["building"]:
-                        site.validated_save()
-                        self.diffsync.objects_to_create["sites"].remove(site)
-                        site_id = self._get_site(diffsync=self.diffsync, building=attrs["building"])
+            _site_slug = nautobot.get_slug(attrs["building"])
+            # a Site created earlier in this sync is only staged so needs saving before the Device can use it
+            for site in self.diffsync.objects_to_create["sites"]:
+                if site.slug == _site_slug:
+                    site.validated_save()
+                    self.diffsync.objects_to_create["sites"].remove(site)
+                    break
+            site_id = self._get_site(diffsync=self.diffsync, building=attrs["building"])
             if site_id:
                 _dev.site_id = site_id
         if "rack_position" in attrs:
@@ -488,34 +493,45 @@ class NautobotDevice(Device):
         if "rack_orientation" in attrs:
             _dev.face = attrs["rack_orientation"]
         if "rack" in attrs:
+            _building = nautobot.get_slug(attrs["building"] if attrs.get("building") else self.building)
+            _room = attrs["room"] if attrs.get("room") else self.room
             try:
-                _dev.rack = OrmRack.objects.get(name=attrs["rack"], group__name=self.room)
-            except OrmRack.DoesNotExist as err:
-                self.diffsync.job.log_warning(message=f"Unable to find rack {attrs['rack']} in {self.room} {err}")
-        if "rack" in attrs and "room" in attrs:
-            try:
-                _dev.rack = OrmRack.objects.get(name=attrs["rack"], group__name=attrs["room"])
-                _dev.site = _dev.rack.site
-            except OrmRack.DoesNotExist as err:
-                if self.diffsync.job.kwargs.get("debug"):
-                    self.diffsync.job.log_warning(
-                        message=f"Unable to find rack {attrs['rack']} in {attrs['room']} {err}"
-                    )
+                _rack_id = self.diffsync.rack_map[_building][nautobot.get_slug(_room)][attrs["rack"]]
+                # a Rack created earlier in this sync is only staged so needs saving, along with any staged Site and
+                # RackGroup it's in, before the Device can use it
+                for rack in self.diffsync.objects_to_create["racks"]:
+                    if rack.id == _rack_id:
+                        for grouping, _parent_id in (("sites", rack.site_id), ("rooms", rack.group_id)):
+                            for parent in self.diffsync.objects_to_create[grouping]:
+                                if parent.id == _parent_id:
+                                    parent.validated_save()
+                                    self.diffsync.objects_to_create[grouping].remove(parent)
+                                    break
+                        rack.validated_save()
+                        self.diffsync.objects_to_create["racks"].remove(rack)
+                        break
+                _dev.rack_id = _rack_id
+                _dev.site_id = self.diffsync.site_map[_building]
+            except KeyError as err:
+                self.diffsync.job.log_warning(message=f"Unable to find rack {attrs['rack']} in {_room} {err}")
         if "hardware" in attrs:
             for new_dt in self.diffsync.objects_to_create["devicetypes"]:
                 if new_dt.model == attrs["hardware"]:
                     new_dt.validated_save()
                     self.diffsync.objects_to_create["devicetypes"].remove(new_dt)
-            _dev.device_type_id = self.diffsync.devicetype_map[slugify(attrs["hardware"])]
+                    break
+            _dev.device_type_id = self.diffsync.devicetype_map[nautobot.get_slug(attrs["hardware"])]
+        _manu_id = None
         if "os" in attrs:
             if attrs.get("hardware"):
                 _hardware = self.diffsync.get(NautobotHardware, attrs["hardware"])
             else:
                 _hardware = self.diffsync.get(NautobotHardware, self.hardware)
+            _manu_id = self.diffsync.vendor_map[nautobot.get_slug(_hardware.manufacturer)]
             _dev.platform_id = nautobot.verify_platform(
                 diffsync=self.diffsync,
                 platform_name=attrs["os"],
-                manu=self.diffsync.vendor_map[slugify(_hardware.manufacturer)],
+                manu=_manu_id,
             )
         if "os_version" in attrs:
             if attrs.get("os"):
@@ -528,7 +544,7 @@ class NautobotDevice(Device):
                         diffsync=self.diffsync,
                         os=_os,
                         version=attrs["os_version"],
-                        manufacturer=_dev.device_type.manufacturer.id,
+                        manufacturer=_manu_id or _dev.device_type.manufacturer_id,
                     )
                     self._assign_version_to_device(diffsync=self.diffsync, device=_dev.id, software_lcm=soft_lcm)
                 else:
@@ -546,10 +562,6 @@ class NautobotDevice(Device):
             _dev.status_id = _status
         if "serial_no" in attrs:
             _dev.serial = attrs["serial_no"]
-        if _dev.device_role.name == "Unknown" and self.tags:
-            _dev.device_role_id = nautobot.verify_device_role(
-                diffsync=self.diffsync, role_name=device42.find_device_role_from_tags(tag_list=self.tags)
-            )
         if "tags" in attrs:
             if attrs.get("tags"):
                 _dev.device_role_id = nautobot.verify_device_role(
@@ -560,6 +572,10 @@ class NautobotDevice(Device):
                     diffsync=self.diffsync, role_name=DEFAULTS.get("device_role")
                 )
             nautobot.update_tags(tagged_obj=_dev, new_tags=attrs["tags"])
+        elif _dev.device_role.name == "Unknown" and self.tags:
+            _dev.device_role_id = nautobot.verify_device_role(
+                diffsync=self.diffsync, role_name=device42.find_device_role_from_tags(tag_list=self.tags)
+            )
         if attrs.get("custom_fields"):
             nautobot.update_custom_fields(new_cfields=attrs["custom_fields"], update_obj=_dev)
         # ensure that VC Master Device is set to that
@@ -589,17 +605,17 @@ class NautobotDevice(Device):
             # need to ensure the new position isn't already taken
             try:
                 if attrs.get("cluster_host"):
-                    vc = OrmVC.objects.get(name=attrs["cluster_host"])
+                    vc = self.diffsync.cluster_map[attrs["cluster_host"]]
                 else:
-                    vc = OrmVC.objects.get(name=self.cluster_host)
+                    vc = self.diffsync.cluster_map[self.cluster_host]
                 try:
-                    dev = OrmDevice.objects.get(virtual_chassis=vc, vc_position=attrs["vc_position"])
+                    dev = OrmDevice.objects.get(virtual_chassis_id=vc, vc_position=attrs["vc_position"])
                     dev.vc_position = None
                     dev.virtual_chassis = None
                     dev.validated_save()
                 except OrmDevice.DoesNotExist:
                     self.diffsync.job.log_info(message=f"Didn't find Device in VC position: {attrs['vc_position']}.")
-            except OrmVC.DoesNotExist as err:
+            except KeyError as err:
                 self.diffsync.job.log_warning(
                     message=f"Unable to find Virtual Chassis {attrs['cluster_host'] if attrs.get('cluster_host') else self.cluster_host}. {err}"
                 )
@@ -621,8 +637,7 @@ class NautobotDevice(Device):
         if PLUGIN_CFG.get("delete_on_sync"):
             super().delete()
             self.diffsync.job.log_info(message=f"Device {self.name} will be deleted.")
-            _dev = OrmDevice.objects.get(id=self.uuid)
-            self.diffsync.objects_to_delete["device"].append(_dev)  # pylint: disable=protected-access
+            self.diffsync.objects_to_delete["device"].add(self.uuid)  # pylint: disable=protected-access
         return self
 
     @staticmethod
@@ -686,17 +701,16 @@ class NautobotPort(Port):
         new_intf = OrmInterface(
             name=ids["name"],
             device_id=_dev,
-            enabled=is_truthy(attrs["enabled"]),
-            mtu=attrs["mtu"] if attrs.get("mtu") else 1500,
+            enabled=nautobot.is_truthy_cached(attrs["enabled"]),
+            mtu=attrs.get("mtu") or 1500,
             description=attrs["description"],
             type=attrs["type"],
-            mac_address=attrs["mac_addr"][:12] if attrs.get("mac_addr") else None,
+            mac_address=attrs.get("mac_addr") or None,
             mode=attrs["mode"],
             status_id=diffsync.status_map[attrs["status"]],
         )
         if attrs.get("tags"):
-            for _tag in nautobot.get_tags(attrs["tags"]):
-                new_intf.tags.add(_tag)
+            new_intf.tags.add(*nautobot.get_tags(attrs["tags"]))
         if attrs.get("custom_fields"):
             nautobot.update_custom_fields(new_cfields=attrs["custom_fields"], update_obj=new_intf)
         if attrs.get("vlans"):
@@ -708,21 +722,21 @@ class NautobotPort(Port):
             diffsync.port_map[ids["device"]] = {}
         diffsync.port_map[ids["device"]][ids["name"]] = new_intf.id
         if attrs.get("mac_addr"):
-            diffsync.port_map[attrs["mac_addr"][:12]] = new_intf.id
+            diffsync.port_map[attrs["mac_addr"]] = new_intf.id
         return super().create(ids=ids, diffsync=diffsync, attrs=attrs)
 
     def update(self, attrs):
         """Update Interface object in Nautobot."""
-        _port = OrmInterface.objects.get(id=self.uuid)
+        _port = OrmInterface.objects.select_related("device").get(id=self.uuid)
         self.diffsync.job.log_info(message=f"Updating Port {_port.name} on {_port.device.name} with {attrs}")
         if "enabled" in attrs:
-            _port.enabled = is_truthy(attrs["enabled"])
+            _port.enabled = nautobot.is_truthy_cached(attrs["enabled"])
         if "mtu" in attrs:
             _port.mtu = attrs["mtu"]
         if "description" in attrs:
             _port.description = attrs["description"]
         if "mac_addr" in attrs:
-            _port.mac_address = attrs["mac_addr"][:12] if attrs.get("mac_addr") else None
+            _port.mac_address = attrs.get("mac_addr") or None
         if "type" in attrs:
             _port.type = attrs["type"]
         if "mode" in attrs:
@@ -746,13 +760,14 @@ class NautobotPort(Port):
             else:
                 _device = self.device
             # must ensure any new VLANs that are created
-            for update_vlan in attrs["vlans"]:
-                for vlan in self.diffsync.objects_to_create["vlans"]:
-                    if vlan.vid == update_vlan and vlan.site == _port.device.site:
-                        new_vlan = self.diffsync.objects_to_create["vlans"].pop(
-                            self.diffsync.objects_to_create["vlans"].index(vlan)
-                        )
-                        new_vlan.validated_save()
+            _vids, _site_id = set(attrs["vlans"]), _port.device.site_id
+            _staged_vlans = []
+            for vlan in self.diffsync.objects_to_create["vlans"]:
+                if vlan.vid in _vids and vlan.site_id == _site_id:
+                    vlan.validated_save()
+                else:
+                    _staged_vlans.append(vlan)
+            self.diffsync.objects_to_create["vlans"] = _staged_vlans
             nautobot.apply_vlans_to_port(
                 diffsync=self.diffsync, device_name=_device, mode=_mode, vlans=attrs["vlans"], port=_port
             )
@@ -770,8 +785,7 @@ class NautobotPort(Port):
         if PLUGIN_CFG.get("delete_on_sync"):
             super().delete()
             self.diffsync.job.log_info(message=f"Interface {self.name} for {self.device} will be deleted.")
-            _intf = OrmInterface.objects.get(id=self.uuid)
-            self.diffsync.objects_to_delete["port"].append(_intf)  # pylint: disable=protected-access
+            self.diffsync.objects_to_delete["port"].add(self.uuid)  # pylint: disable=protected-access
         return self
 
 
@@ -899,13 +913,13 @@ class NautobotConnection(Connection):
             circuit_term.validated_save()
         if _intf and not _intf.cable and not circuit_term.cable:
             new_cable = OrmCable(
-                termination_a_type=ContentType.objects.get(app_label="dcim", model="interface")
+                termination_a_type=ContentType.objects.get_for_model(OrmInterface)
                 if attrs["src_type"] == "interface"
-                else ContentType.objects.get(app_label="dcim", model="frontport"),
+                else ContentType.objects.get_for_model(OrmFrontPort),
                 termination_a_id=_intf,
-                termination_b_type=ContentType.objects.get(app_label="circuits", model="circuittermination"),
+                termination_b_type=ContentType.objects.get_for_model(OrmCT),
                 termination_b_id=circuit_term.id,
-                status=OrmStatus.objects.get(name="Connected"),
+                status_id=diffsync.status_map["connected"],
                 color=nautobot.get_random_color(),
             )
             return new_cable
@@ -947,9 +961,9 @@ class NautobotConnection(Connection):
                 return None
         if _src_port and _dst_port:
             new_cable = OrmCable(
-                termination_a_type=ContentType.objects.get(app_label="dcim", model="interface"),
+                termination_a_type=ContentType.objects.get_for_model(OrmInterface),
                 termination_a_id=_src_port,
-                termination_b_type=ContentType.objects.get(app_label="dcim", model="interface"),
+                termination_b_type=ContentType.objects.get_for_model(OrmInterface),
                 termination_b_id=_dst_port,
                 status_id=diffsync.status_map["connected"],
                 color=nautobot.get_random_color(),
@@ -965,6 +979,5 @@ class NautobotConnection(Connection):
             self.diffsync.job.log_info(
                 message=f"Deleting Cable between {self.src_device}'s {self.src_port} port to {self.dst_device} {self.dst_port} port."
             )
-            _conn = OrmCable.objects.get(id=self.uuid)
-            _conn.delete()
+            OrmCable.objects.filter(id=self.uuid).delete()
         return self
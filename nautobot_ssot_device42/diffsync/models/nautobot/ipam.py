@@ -3,9 +3,7 @@
 import re
 from django.contrib.contenttypes.models import ContentType
 from django.forms import ValidationError
-from django.utils.text import slugify
 from nautobot.dcim.models import Interface as OrmInterface
-from nautobot.extras.models import Status as OrmStatus
 from nautobot.ipam.models import VLAN as OrmVLAN
 from nautobot.ipam.models import VRF as OrmVRF
 from nautobot.ipam.models import IPAddress as OrmIPAddress
@@ -14,6 +12,8 @@ from nautobot_ssot_device42.constant import PLUGIN_CFG
 from nautobot_ssot_device42.diffsync.models.base.ipam import VLAN, IPAddress, Subnet, VRFGroup
 from nautobot_ssot_device42.utils import nautobot
 
+_LOOPBACK_RE = re.compile(r"[Ll]oopback")
+
 
 class NautobotVRFGroup(VRFGroup):
     """Nautobot VRFGroup model."""
@@ -24,8 +24,7 @@ class NautobotVRFGroup(VRFGroup):
         _vrf = OrmVRF(name=ids["name"], description=attrs["description"])
         diffsync.job.log_info(message=f"Creating VRF {_vrf.name}.")
         if attrs.get("tags"):
-            for _tag in nautobot.get_tags(attrs["tags"]):
-                _vrf.tags.add(_tag)
+            _vrf.tags.add(*nautobot.get_tags(attrs["tags"]))
         if attrs.get("custom_fields"):
             nautobot.update_custom_fields(new_cfields=attrs["custom_fields"], update_obj=_vrf)
         diffsync.objects_to_create["vrfs"].append(_vrf)
@@ -58,8 +57,7 @@ class NautobotVRFGroup(VRFGroup):
         if PLUGIN_CFG.get("delete_on_sync"):
             super().delete()
             self.diffsync.job.log_info(message=f"VRF {self.name} will be deleted.")
-            vrf = OrmVRF.objects.get(id=self.uuid)
-            self.diffsync.objects_to_delete["vrf"].append(vrf)  # pylint: disable=protected-access
+            self.diffsync.objects_to_delete["vrf"].add(self.uuid)  # pylint: disable=protected-access
         return self
 
 
@@ -82,8 +80,7 @@ class NautobotSubnet(Subnet):
             status_id=diffsync.status_map["active"],
         )
         if attrs.get("tags"):
-            for _tag in nautobot.get_tags(attrs["tags"]):
-                _pf.tags.add(_tag)
+            _pf.tags.add(*nautobot.get_tags(attrs["tags"]))
         if attrs.get("custom_fields"):
             nautobot.update_custom_fields(new_cfields=attrs["custom_fields"], update_obj=_pf)
         diffsync.objects_to_create["prefixes"].append(_pf)
@@ -117,9 +114,8 @@ class NautobotSubnet(Subnet):
         """
         if PLUGIN_CFG.get("delete_on_sync"):
             super().delete()
-            subnet = OrmPrefix.objects.get(id=self.uuid)
-            self.diffsync.job.log_info(message=f"Prefix {subnet.prefix} will be deleted.")
-            self.diffsync.objects_to_delete["subnet"].append(subnet)  # pylint: disable=protected-access
+            self.diffsync.job.log_info(message=f"Prefix {self.network}/{self.mask_bits} will be deleted.")
+            self.diffsync.objects_to_delete["subnet"].add(self.uuid)  # pylint: disable=protected-access
         return self
 
 
@@ -145,39 +141,36 @@ class NautobotIPAddress(IPAddress):
         # mgmt = r"^[mM]anagement|^[mM]gmt"
 
         _address = ids["address"]
+        _vrf_name = ids.get("vrf")
+        _device, _intf_name = attrs.get("device"), attrs.get("interface")
         _ip = OrmIPAddress(
             address=_address,
-            vrf_id=diffsync.vrf_map[ids["vrf"]] if ids.get("vrf") else None,
+            vrf_id=diffsync.vrf_map[_vrf_name] if _vrf_name else None,
             status_id=diffsync.status_map["active"] if not attrs.get("available") else diffsync.status_map["reserved"],
-            description=attrs["label"] if attrs.get("label") else "",
+            description=attrs.get("label") or "",
         )
-        if attrs.get("device") and attrs.get("interface"):
+        if _device and _intf_name:
             try:
                 diffsync.job.log_info(message=f"Creating IPAddress {_address}.")
-                intf = diffsync.port_map[attrs["device"]][attrs["interface"]]
-                _ip.assigned_object_type = ContentType.objects.get(app_label="dcim", model="interface")
+                intf = diffsync.port_map[_device][_intf_name]
+                _ip.assigned_object_type = ContentType.objects.get_for_model(OrmInterface)
                 _ip.assigned_object_id = intf
 
                 if attrs.get("primary"):
-                    diffsync.objects_to_create["device_primary_ip"].append(
-                        (diffsync.device_map[attrs["device"]], _ip.id)
-                    )
+                    diffsync.objects_to_create["device_primary_ip"].append((diffsync.device_map[_device], _ip.id))
             except KeyError:
-                diffsync.job.log_debug(
-                    message=f"Unable to find Interface {attrs['interface']} for {attrs['device']}.",
-                )
-        if attrs.get("interface"):
-            if re.search(r"[Ll]oopback", attrs["interface"]):
-                _ip.role = "loopback"
+                if diffsync.job.kwargs.get("debug"):
+                    diffsync.job.log_debug(
+                        message=f"Unable to find Interface {_intf_name} for {_device}.",
+                    )
+        if _intf_name and _LOOPBACK_RE.search(_intf_name):
+            _ip.role = "loopback"
         if attrs.get("tags"):
             nautobot.update_tags(tagged_obj=_ip, new_tags=attrs["tags"])
         if attrs.get("custom_fields"):
             nautobot.update_custom_fields(new_cfields=attrs["custom_fields"], update_obj=_ip)
         diffsync.objects_to_create["ipaddrs"].append(_ip)
-        if ids.get("vrf"):
-            vrf_name = ids["vrf"]
-        else:
-            vrf_name = "global"
+        vrf_name = _vrf_name or "global"
         if vrf_name not in diffsync.ipaddr_map:
             diffsync.ipaddr_map[vrf_name] = {}
         diffsync.ipaddr_map[vrf_name][_address] = _ip.id
@@ -197,10 +190,8 @@ class NautobotIPAddress(IPAddress):
             message=f"Updating IPAddress {_ipaddr.address} for {_ipaddr.vrf.name if _ipaddr.vrf else ''}"
         )
         if "available" in attrs:
-            _ipaddr.status = (
-                OrmStatus.objects.get(name="Active")
-                if not attrs["available"]
-                else OrmStatus.objects.get(name="Reserved")
+            _ipaddr.status_id = (
+                self.diffsync.status_map["active"] if not attrs["available"] else self.diffsync.status_map["reserved"]
             )
         if "label" in attrs:
             _ipaddr.description = attrs["label"] if attrs.get("label") else ""
@@ -209,29 +200,30 @@ class NautobotIPAddress(IPAddress):
             if self.primary:
                 nautobot.unassign_primary(_ipaddr)
             try:
-                intf = OrmInterface.objects.get(device__name=_device, name=attrs["interface"])
-                _ipaddr.assigned_object_type = ContentType.objects.get(app_label="dcim", model="interface")
-                _ipaddr.assigned_object_id = intf.id
+                intf = self.diffsync.port_map[_device][attrs["interface"]]
+                _ipaddr.assigned_object_type = ContentType.objects.get_for_model(OrmInterface)
+                _ipaddr.assigned_object_id = intf
                 try:
                     _ipaddr.validated_save()
                 except ValidationError as err:
                     self.diffsync.job.log_warning(
                         message=f"Failure updating Device & Interface for {_ipaddr.address}. {err}"
                     )
-            except OrmInterface.DoesNotExist as err:
+            except KeyError as err:
                 self.diffsync.job.log_warning(
                     message=f"Unable to find Interface {attrs['interface']} for {attrs['device']}. {err}"
                 )
         elif attrs.get("device"):
             try:
-                intf = OrmInterface.objects.get(device__name=attrs["device"], name=self.interface)
-                _ipaddr.assigned_object_type = ContentType.objects.get(app_label="dcim", model="interface")
-                _ipaddr.assigned_object_id = intf.id
+                intf = self.diffsync.port_map[attrs["device"]][self.interface]
+                _ipaddr.assigned_object_type = ContentType.objects.get_for_model(OrmInterface)
+                _ipaddr.assigned_object_id = intf
                 nautobot.unassign_primary(_ipaddr)
-            except OrmInterface.DoesNotExist as err:
-                self.diffsync.job.log_debug(
-                    message=f"Unable to find Interface {attrs['interface'] if attrs.get('interface') else self.interface} for {attrs['device']} {err}"
-                )
+            except KeyError as err:
+                if self.diffsync.job.kwargs.get("debug"):
+                    self.diffsync.job.log_debug(
+                        message=f"Unable to find Interface {attrs['interface'] if attrs.get('interface') else self.interface} for {attrs['device']} {err}"
+                    )
         elif attrs.get("interface"):
             try:
                 OrmInterface.objects.get(name=attrs["interface"], device__name=self.device)
@@ -249,16 +241,17 @@ class NautobotIPAddress(IPAddress):
                     intf = self.diffsync.port_map[attrs["device"]][attrs["interface"]]
                 else:
                     intf = self.diffsync.port_map[self.device][attrs["interface"]]
-                _ipaddr.assigned_object_type = ContentType.objects.get(app_label="dcim", model="interface")
+                _ipaddr.assigned_object_type = ContentType.objects.get_for_model(OrmInterface)
                 _ipaddr.assigned_object_id = intf
                 try:
                     _ipaddr.validated_save()
                 except ValidationError as err:
                     self.diffsync.job.log_warning(message=f"Failure updating Interface for {_ipaddr.address}. {err}")
             except KeyError as err:
-                self.diffsync.job.log_debug(
-                    message=f"Unable to find Interface {attrs['interface']} for {attrs['device'] if attrs.get('device') else self.device}. {err}"
-                )
+                if self.diffsync.job.kwargs.get("debug"):
+                    self.diffsync.job.log_debug(
+                        message=f"Unable to find Interface {attrs['interface']} for {attrs['device'] if attrs.get('device') else self.device}. {err}"
+                    )
         if attrs.get("primary") or self.primary is True:
             if getattr(_ipaddr, "assigned_object"):
                 if _ipaddr.family == 4:
@@ -294,8 +287,7 @@ class NautobotIPAddress(IPAddress):
         if PLUGIN_CFG.get("delete_on_sync"):
             super().delete()
             self.diffsync.job.log_info(message=f"IP Address {self.address} will be deleted.")
-            ipaddr = OrmIPAddress.objects.get(id=self.uuid)
-            self.diffsync.objects_to_delete["ipaddr"].append(ipaddr)  # pylint: disable=protected-access
+            self.diffsync.objects_to_delete["ipaddr"].add(self.uuid)  # pylint: disable=protected-access
         return self
 
 
@@ -307,7 +299,7 @@ class NautobotVLAN(VLAN):
         """Create VLAN object in Nautobot."""
         _site_name = None, None
         if ids["building"] != "Unknown":
-            _site_name = slugify(ids["building"])
+            _site_name = nautobot.get_slug(ids["building"])
         else:
             _site_name = "global"
         diffsync.job.log_info(message=f"Creating VLAN {ids['vlan_id']} {attrs['name']} for {_site_name}")
@@ -358,6 +350,5 @@ class NautobotVLAN(VLAN):
         if PLUGIN_CFG.get("delete_on_sync"):
             super().delete()
             self.diffsync.job.log_info(message=f"VLAN {self.name} {self.vlan_id} {self.building} will be deleted.")
-            vlan = OrmVLAN.objects.get(id=self.uuid)
-            self.diffsync.objects_to_delete["vlan"].append(vlan)  # pylint: disable=protected-access
+            self.diffsync.objects_to_delete["vlan"].add(self.uuid)  # pylint: disable=protected-access
         return self
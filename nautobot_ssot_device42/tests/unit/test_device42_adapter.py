@@ -63,7 +63,7 @@ class Device42AdapterTestCase(TransactionTestCase):  # pylint: disable=too-many-
         self.d42_client.get_subnet_default_custom_fields.return_value = SUBNET_DEFAULT_CFS_FIXTURE
         self.d42_client.get_subnet_custom_fields.return_value = SUBNET_CFS_FIXTURE
         self.d42_client.get_subnets.return_value = SUBNET_FIXTURE
-        self.d42_client.get_devices.return_value = DEVICE_FIXTURE
+        self.d42_client.stream_devices.return_value = DEVICE_FIXTURE
         self.d42_client.get_cluster_members.return_value = CLUSTER_MEMBER_FIXTURE
         self.d42_client.get_ports_with_vlans.return_value = PORTS_W_VLANS_FIXTURE
         self.d42_client.get_ports_wo_vlans.return_value = PORTS_WO_VLANS_FIXTURE
@@ -225,6 +225,54 @@ class Device42AdapterTestCase(TransactionTestCase):  # pylint: disable=too-many-
             message="Cluster stack01.testexample.com has ignore tag so skipping."
         )
 
+    @patch(
+        "nautobot_ssot_device42.diffsync.adapters.device42.PLUGIN_CFG",
+        {"customer_is_facility": True},
+    )
+    def test_load_devices_and_clusters_member_before_cluster(self):
+        """Validate load_devices_and_clusters() when a cluster member Device is streamed before its Cluster."""
+        self.d42_client.stream_devices.return_value = [DEVICE_FIXTURE[4], DEVICE_FIXTURE[3]]
+        self.device42.load_buildings()
+        self.device42.load_rooms()
+        self.device42.load_racks()
+        self.device42.load_vendors()
+        self.device42.load_hardware_models()
+        self.device42.load_devices_and_clusters()
+        self.assertEqual(
+            {"stack01.testexample.com"}, {cluster.get_unique_id() for cluster in self.device42.get_all("cluster")}
+        )
+        member = self.device42.get("device", "stack01.testexample.com - Switch 1")
+        self.assertEqual(member.cluster_host, "stack01.testexample.com")
+        self.assertEqual(member.vc_position, 2)
+        self.assertFalse(member.master_device)
+        master = self.device42.get("device", "stack01.testexample.com")
+        self.assertTrue(master.master_device)
+        self.assertEqual(master.vc_position, 1)
+
+    @patch(
+        "nautobot_ssot_device42.diffsync.adapters.device42.PLUGIN_CFG",
+        {"customer_is_facility": True},
+    )
+    def test_load_devices_and_clusters_device_named_as_cluster(self):
+        """Validate load_devices_and_clusters() when a Device with a Cluster's name is streamed before the Cluster."""
+        self.d42_client.stream_devices.return_value = [
+            {**DEVICE_FIXTURE[4], "name": "stack01.testexample.com"},
+            DEVICE_FIXTURE[3],
+        ]
+        self.device42.load_buildings()
+        self.device42.load_rooms()
+        self.device42.load_racks()
+        self.device42.load_vendors()
+        self.device42.load_hardware_models()
+        self.device42.load_devices_and_clusters()
+        self.assertEqual(
+            {"stack01.testexample.com"}, {cluster.get_unique_id() for cluster in self.device42.get_all("cluster")}
+        )
+        self.assertFalse(self.device42.get("device", "stack01.testexample.com").master_device)
+        self.job.log_warning.assert_called_with(
+            message="Duplicate device attempting to be added. ('Object stack01.testexample.com already present', device \"stack01.testexample.com\")"
+        )
+
     def test_load_devices_with_blank_building(self):
         """Validate functionality of the load_devices_and_clusters() function when device has a blank building."""
         self.device42.load_hardware_models()
@@ -0,0 +1,60 @@
+"""Tests of Nautobot DiffSync models."""
+from unittest.mock import MagicMock
+from nautobot.utilities.testing import TransactionTestCase
+from nautobot.dcim.models import Device, DeviceRole, DeviceType, Manufacturer, Rack, RackGroup, Site
+from nautobot.extras.models import Status
+from nautobot_ssot_device42.diffsync.models.nautobot.dcim import NautobotDevice
+
+
+class TestNautobotDevice(TransactionTestCase):
+    """Test Nautobot Device DiffSync model."""
+
+    databases = ("default", "job_logs")
+
+    def setUp(self):
+        """Setup shared test objects."""
+        super().setUp()
+        self.status_active = Status.objects.get(name="Active")
+        self.site = Site.objects.create(name="Test Site", slug="test-site", status=self.status_active)
+        self.room = RackGroup.objects.create(name="Room 1", slug="room-1", site=self.site)
+        _manu, _ = Manufacturer.objects.get_or_create(name="Cisco")
+        _dt = DeviceType.objects.create(model="CSR1000v", slug="csr1000v", manufacturer=_manu)
+        _dr = DeviceRole.objects.create(name="CORE", slug="core")
+        self.dev = Device.objects.create(
+            name="Test", device_role=_dr, device_type=_dt, site=self.site, status=self.status_active
+        )
+        self.dsync = MagicMock()
+        self.dsync.site_map = {"test-site": self.site.id}
+        self.dsync.rack_map = {"test-site": {"room-1": {}}}
+        self.dsync.objects_to_create = {"sites": [], "rooms": [], "racks": []}
+        self.mock_dev = NautobotDevice(
+            name="Test",
+            building="Test Site",
+            room="Room 1",
+            rack=None,
+            rack_position=None,
+            rack_orientation=None,
+            hardware="CSR1000v",
+            os=None,
+            os_version=None,
+            in_service=True,
+            serial_no="",
+            tags=[],
+            cluster_host=None,
+            master_device=False,
+            vc_position=None,
+            custom_fields=None,
+            uuid=self.dev.id,
+            diffsync=self.dsync,
+        )
+
+    def test_update_device_into_rack_created_in_same_sync(self):
+        """Validate that a Device moved into a Rack staged earlier in the same sync saves that Rack first."""
+        new_rack = Rack(name="Rack 1", site=self.site, group=self.room, status=self.status_active)
+        self.dsync.objects_to_create["racks"].append(new_rack)
+        self.dsync.rack_map["test-site"]["room-1"]["Rack 1"] = new_rack.id
+        self.mock_dev.update(attrs={"rack": "Rack 1"})
+        self.assertTrue(Rack.objects.filter(id=new_rack.id).exists())
+        self.assertEqual(self.dsync.objects_to_create["racks"], [])
+        self.dev.refresh_from_db()
+        self.assertEqual(self.dev.rack_id, new_rack.id)
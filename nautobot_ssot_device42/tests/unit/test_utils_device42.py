@@ -159,6 +159,18 @@ class TestUtilsDevice42(TestCase):
     def test_get_intf_status(self, name, sent, received):  # pylint: disable=unused-argument
         self.assertEqual(device42.get_intf_status(sent), received)
 
+    mac_addresses = [
+        ("no_separators", "0050569a1b2c", "0050569a1b2c"),
+        ("colons", "00:50:56:9A:1B:2C", "0050569a1b2c"),
+        ("dashes", "00-50-56-9a-1b-2c", "0050569a1b2c"),
+        ("dots", "0050.569a.1b2c", "0050569a1b2c"),
+        ("empty", "", ""),
+    ]
+
+    @parameterized.expand(mac_addresses, skip_on_empty=True)
+    def test_normalize_mac(self, name, sent, received):  # pylint: disable=unused-argument
+        self.assertEqual(device42.normalize_mac(sent), received)
+
     netmiko_platforms = [
         ("asa", "asa", "cisco_asa"),
         ("ios", "ios", "cisco_ios"),
@@ -399,6 +411,55 @@ class TestDevice42Api(TestCase):  # pylint: disable=too-many-public-methods
         self.assertEqual(response, expected)
         self.assertTrue(len(responses.calls) == 1)
 
+    @responses.activate
+    def test_stream_devices(self):
+        """Test stream_devices success."""
+        test_query = load_json("./nautobot_ssot_device42/tests/fixtures/get_devices_sent.json")
+        responses.add(
+            responses.GET,
+            "https://device42.testexample.com/api/1.0/devices/all/?is_it_switch=yes&_paging=1&_return_as_object=1&_max_results=1000",
+            json=test_query,
+            status=200,
+        )
+        expected = load_json("./nautobot_ssot_device42/tests/fixtures/get_devices_recv.json")
+        response = self.dev42.stream_devices()
+        self.assertEqual(list(response), expected)
+        self.assertTrue(len(responses.calls) == 1)
+
+    @responses.activate
+    def test_stream_devices_paginated(self):
+        """Test stream_devices follows the pagination returned by Device42 when it limits the page size."""
+        test_query = load_json("./nautobot_ssot_device42/tests/fixtures/get_devices_sent.json")
+        url = "https://device42.testexample.com/api/1.0/devices/all/?is_it_switch=yes&_paging=1&_return_as_object=1&_max_results=1000"
+        for offset, suffix in ((0, ""), (2, "&offset=2"), (4, "&offset=4")):
+            responses.add(
+                responses.GET,
+                url + suffix,
+                json={
+                    "Devices": test_query["Devices"][offset : offset + 2],
+                    "total_count": 5,
+                    "limit": 2,
+                    "offset": offset,
+                },
+                status=200,
+            )
+        expected = load_json("./nautobot_ssot_device42/tests/fixtures/get_devices_recv.json")
+        response = self.dev42.stream_devices()
+        self.assertEqual(list(response), expected)
+        self.assertTrue(len(responses.calls) == 3)
+
+    @responses.activate
+    def test_stream_devices_http_error(self):
+        """Test stream_devices stops without raising when Device42 returns an error."""
+        responses.add(
+            responses.GET,
+            "https://device42.testexample.com/api/1.0/devices/all/?is_it_switch=yes&_paging=1&_return_as_object=1&_max_results=1000",
+            status=500,
+        )
+        response = self.dev42.stream_devices()
+        self.assertEqual(list(response), [])
+        self.assertTrue(len(responses.calls) == 1)
+
     @responses.activate
     def test_get_cluster_members(self):
         """Test get_cluster_members success."""
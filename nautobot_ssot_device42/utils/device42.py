@@ -1,8 +1,12 @@
 """Utility functions for Device42 API."""
 
+import logging
 import re
-from typing import List
+from functools import lru_cache
+from typing import Iterator, List, Optional, Tuple
 
+import ijson
+import orjson
 import requests
 import urllib3
 from diffsync.exceptions import ObjectNotFound
@@ -12,6 +16,8 @@ from netutils.lib_mapper import PYATS_LIB_MAPPER
 from nautobot_ssot_device42.constant import DEFAULTS, FC_INTF_MAP, INTF_NAME_MAP, PHY_INTF_MAP, PLUGIN_CFG
 from nautobot_ssot_device42.diffsync.models.base.ipam import VLAN
 
+logger = logging.getLogger(__name__)
+
 
 class MissingConfigSetting(Exception):
     """Exception raised for missing configuration settings.
@@ -114,17 +120,35 @@ def get_intf_status(port: dict):
     """
     _status = "planned"
     if "up" in port and "up_admin" in port:
-        if not is_truthy(port["up"]) and not is_truthy(port["up_admin"]):
+        _up, _up_admin = is_truthy(port["up"]), is_truthy(port["up_admin"])
+        if not _up and not _up_admin:
             _status = "decommissioning"
-        elif not is_truthy(port["up"]) and is_truthy(port["up_admin"]):
+        elif not _up and _up_admin:
             _status = "failed"
-        elif is_truthy(port["up"]) and is_truthy(port["up_admin"]):
+        elif _up and _up_admin:
             _status = "active"
     elif port.get("up_admin"):
         _status = "active"
     return _status
 
 
+_MAC_SEPARATORS = str.maketrans("", "", ":-. ")
+
+
+def normalize_mac(mac_addr: str) -> str:
+    """Method to normalize a MAC address to 12 lowercase hex characters without separators.
+
+    Args:
+        mac_addr (str): MAC address as provided by Device42.
+
+    Returns:
+        str: Normalized MAC address or empty string if none provided.
+    """
+    if not mac_addr:
+        return ""
+    return mac_addr.translate(_MAC_SEPARATORS).lower()[:12]
+
+
 def get_netmiko_platform(network_os: str) -> str:
     """Method to return the netmiko platform if a pyATS platform is provided.
 
@@ -143,6 +167,12 @@ def get_netmiko_platform(network_os: str) -> str:
     return network_os
 
 
+@lru_cache(maxsize=8)
+def _compile_prepend(prepend: str) -> re.Pattern:
+    """Compile a Tag prefix setting, such as `role_prepend`, once per distinct value."""
+    return re.compile(prepend)
+
+
 def find_device_role_from_tags(tag_list: List[str]) -> str:
     """Determine a Device role based upon a Tag matching the `role_prepend` setting.
 
@@ -154,9 +184,11 @@ def find_device_role_from_tags(tag_list: List[str]) -> str:
     """
     _prepend = PLUGIN_CFG.get("role_prepend")
     if _prepend:
+        _pattern = _compile_prepend(_prepend)
         for _tag in tag_list:
-            if re.search(_prepend, _tag):
-                return re.sub(_prepend, "", _tag)
+            _role, _found = _pattern.subn("", _tag)
+            if _found:
+                return _role
     return DEFAULTS.get("device_role")
 
 
@@ -165,9 +197,11 @@ def get_facility(tags: List[str], diffsync=None):  # pylint: disable=inconsisten
     if not PLUGIN_CFG.get("facility_prepend"):
         diffsync.log_failure(message="The `facility_prepend` setting is missing or invalid.")
         raise MissingConfigSetting("facility_prepend")
+    _pattern = _compile_prepend(PLUGIN_CFG["facility_prepend"])
     for _tag in tags:
-        if re.search(PLUGIN_CFG.get("facility_prepend"), _tag):
-            return re.sub(PLUGIN_CFG.get("facility_prepend"), "", _tag)
+        _facility, _found = _pattern.subn("", _tag)
+        if _found:
+            return _facility
 
 
 def get_custom_field_dict(cfields: List[dict]) -> dict:
@@ -246,6 +280,50 @@ class Device42API:  # pylint: disable=too-many-public-methods
             return full_path
         return full_path
 
+    @staticmethod
+    def _paging_params(params: Optional[dict] = None) -> dict:
+        """Method to add the Device42 pagination settings to request parameters.
+
+        Args:
+            params (dict, optional): Additional parameters to send to API. Defaults to None.
+
+        Returns:
+            dict: Parameters with pagination settings included.
+        """
+        if params is None:
+            params = {}
+
+        params.update(
+            {
+                "_paging": "1",
+                "_return_as_object": "1",
+                "_max_results": "1000",
+            }
+        )
+        return params
+
+    @staticmethod
+    def _next_offset(page: dict, counter: int, url: str) -> Optional[int]:
+        """Method to determine the offset of the next page of a paginated Device42 response.
+
+        Args:
+            page (dict): Response data containing the `total_count`, `offset`, and `limit` returned by Device42.
+            counter (int): Number of additional pages already requested.
+            url (str): URL being requested, used for logging.
+
+        Returns:
+            Optional[int]: Offset of the next page or None if there are no more pages to request.
+        """
+        if not isinstance(page, dict) or not page.get("total_count"):
+            return None
+        if page["offset"] + page["limit"] >= page["total_count"]:
+            return None
+        # Handle possible infinite loop.
+        if counter > 10000:
+            logger.warning("Too many pagination loops in Device42 request to %s. Possible infinite loop.", url)
+            return None
+        return page["offset"] + page["limit"]
+
     def api_call(self, path: str, method: str = "GET", params: dict = None, payload: dict = None):
         """Method to send Request to Device42 of type `method`. Defaults to GET request.
 
@@ -263,17 +341,7 @@ class Device42API:  # pylint: disable=too-many-public-methods
         """
         url = self.validate_url(path)
         return_data = {}
-
-        if params is None:
-            params = {}
-
-        params.update(
-            {
-                "_paging": "1",
-                "_return_as_object": "1",
-                "_max_results": "1000",
-            }
-        )
+        params = self._paging_params(params)
 
         resp = requests.request(
             method=method,
@@ -287,48 +355,103 @@ class Device42API:  # pylint: disable=too-many-public-methods
         try:
             resp.raise_for_status()
         except requests.exceptions.HTTPError as err:
-            print(f"Error in communicating to Device42 API: {err}")
+            logger.error("Error in communicating to Device42 API: %s", err)
             return False
 
-        return_data = resp.json()
-        # print(f"Total count for {url}: {return_data.get('total_count')}")
+        return_data = orjson.loads(resp.content)
         # Handle Device42 pagination
         counter = 0
         pagination = False
-        if isinstance(return_data, dict) and return_data.get("total_count"):
-            while (return_data.get("offset") + return_data.get("limit")) < return_data.get("total_count"):
-                pagination = True
-                # print("Handling paginated response from Device42.")
-                new_offset = return_data["offset"] + return_data["limit"]
-                params.update({"offset": new_offset})
-                counter += 1
-                response = requests.request(
-                    method="GET",
-                    headers=self.headers,
-                    auth=(self.username, self.password),
-                    url=url,
-                    params=params,
-                    verify=self.verify,
-                )
-                response.raise_for_status()
-                return_data = merge_offset_dicts(return_data, response.json())
-                # print(
-                #     f"Number of devices: {len(return_data['Devices'])}.\noffset: {return_data.get('offset')}.\nlimit: {return_data.get('limit')}."
-                # )
-
-                # Handle possible infinite loop.
-                if counter > 10000:
-                    print("Too many pagination loops in Device42 request. Possible infinite loop.")
-                    print(url)
-                    break
-
-            # print(f"Exiting API request loop after {counter} loops.")
+        new_offset = self._next_offset(return_data, counter, url)
+        while new_offset is not None:
+            pagination = True
+            params.update({"offset": new_offset})
+            counter += 1
+            response = requests.request(
+                method="GET",
+                headers=self.headers,
+                auth=(self.username, self.password),
+                url=url,
+                params=params,
+                verify=self.verify,
+            )
+            response.raise_for_status()
+            return_data = merge_offset_dicts(return_data, orjson.loads(response.content))
+            new_offset = self._next_offset(return_data, counter, url)
 
         if pagination:
             return_data.pop("offset", None)
 
         return return_data
 
+    @staticmethod
+    def _parse_page(stream, item_path: str) -> Tuple[dict, List[dict]]:
+        """Method to incrementally parse a page of a Device42 response.
+
+        Args:
+            stream (file-like): Raw response body to be parsed.
+            item_path (str): ijson prefix of the records to be returned, ie `Devices.item`.
+
+        Returns:
+            Tuple[dict, List[dict]]: Pagination details (`total_count`, `offset`, `limit`) and records found at `item_path`.
+        """
+        page, records, builder = {}, [], None
+        for prefix, event, value in ijson.parse(stream, use_float=True):
+            if builder is not None:
+                builder.event(event, value)
+                if prefix == item_path and event in ("end_map", "end_array"):
+                    records.append(builder.value)
+                    builder = None
+            elif prefix == item_path and event in ("start_map", "start_array"):
+                builder = ijson.ObjectBuilder()
+                builder.event(event, value)
+            elif prefix in ("total_count", "offset", "limit"):
+                page[prefix] = value
+        return page, records
+
+    def api_stream(self, path: str, item_path: str, params: dict = None) -> Iterator[dict]:
+        """Method to stream records from a paginated GET request to Device42.
+
+        Unlike `api_call`, pages aren't merged into a single payload. Each page is parsed incrementally and its records
+        yielded once the connection is released, so only one page of records is held in memory at a time. Pagination
+        follows the `total_count`, `offset`, and `limit` returned by Device42, as with `api_call`.
+
+        Args:
+            path (str): API path to send request to.
+            item_path (str): ijson prefix of the records to be returned, ie `Devices.item`.
+            params (dict, optional): Additional parameters to send to API. Defaults to None.
+
+        Yields:
+            dict: Each record found at `item_path` in the API response. Nothing further is yielded if a request errors.
+        """
+        url = self.validate_url(path)
+        params = self._paging_params(params)
+
+        counter = 0
+        while True:
+            with requests.request(
+                method="GET",
+                headers=self.headers,
+                auth=(self.username, self.password),
+                url=url,
+                params=params,
+                verify=self.verify,
+                stream=True,
+            ) as resp:
+                try:
+                    resp.raise_for_status()
+                except requests.exceptions.HTTPError as err:
+                    logger.error("Error in communicating to Device42 API: %s", err)
+                    return
+                resp.raw.decode_content = True
+                page, records = self._parse_page(resp.raw, item_path)
+            yield from records
+            new_offset = self._next_offset(page, counter, url)
+            if new_offset is None:
+                break
+            params.update({"offset": new_offset})
+            counter += 1
+
     def doql_query(self, query: str) -> dict:
         """Method to perform a DOQL query against Device42.
 
@@ -399,6 +522,10 @@ class Device42API:  # pylint: disable=too-many-public-methods
         """Method to get all Network Devices from Device42."""
         return self.api_call(path="api/1.0/devices/all/?is_it_switch=yes")["Devices"]
 
+    def stream_devices(self) -> Iterator[dict]:
+        """Method to stream all Network Devices from Device42 one page at a time."""
+        return self.api_stream(path="api/1.0/devices/all/?is_it_switch=yes", item_path="Devices.item")
+
     def get_cluster_members(self) -> dict:
         """Method to get all member devices of a cluster from Device42.
 
@@ -1,5 +1,6 @@
 """Utility functions for Nautobot ORM."""
 import random
+from functools import lru_cache
 from typing import List, OrderedDict
 from uuid import UUID
 
@@ -7,6 +8,7 @@ from diffsync.exceptions import ObjectNotFound
 from django.contrib.contenttypes.models import ContentType
 from django.utils.text import slugify
 from nautobot.circuits.models import CircuitType
+from nautobot.core.settings_funcs import is_truthy
 from nautobot.dcim.models import Device, DeviceRole, Interface, Platform
 from nautobot.extras.choices import CustomFieldTypeChoices
 from nautobot.extras.models import CustomField, Relationship, Tag
@@ -34,6 +36,23 @@ def get_random_color() -> str:
     return f"{random.randint(0, 0xFFFFFF):06x}"
 
 
+@lru_cache(maxsize=4096)
+def get_slug(name: str) -> str:
+    """Get slug for a name, memoized as the same names are slugified for every object referencing them.
+
+    Args:
+        name (str): Name to be slugified.
+
+    Returns:
+        str: Slugified version of name.
+    """
+    return slugify(name)
+
+
+# Flags such as a Port's enabled state only ever take a handful of values, so is_truthy results are cached.
+is_truthy_cached = lru_cache(maxsize=32)(is_truthy)
+
+
 def verify_device_role(diffsync, role_name: str, role_color: str = "") -> UUID:
     """Verifies DeviceRole object exists in Nautobot. If not, creates it.
 
@@ -47,12 +66,13 @@ def verify_device_role(diffsync, role_name: str, role_color: str = "") -> UUID:
     """
     if not role_color:
         role_color = get_random_color()
+    _slug = get_slug(role_name)
     try:
-        role_obj = diffsync.devicerole_map[slugify(role_name)]
+        role_obj = diffsync.devicerole_map[_slug]
     except KeyError:
-        role_obj = DeviceRole(name=role_name, slug=slugify(role_name), color=role_color)
+        role_obj = DeviceRole(name=role_name, slug=_slug, color=role_color)
         diffsync.objects_to_create["deviceroles"].append(role_obj)
-        diffsync.devicerole_map[slugify(role_name)] = role_obj.id
+        diffsync.devicerole_map[_slug] = role_obj.id
         role_obj = role_obj.id
     return role_obj
 
@@ -68,25 +88,26 @@ def verify_platform(diffsync, platform_name: str, manu: UUID) -> UUID:
     Returns:
         UUID: UUID for found or created Platform object.
     """
-    if ANSIBLE_LIB_MAPPER_REVERSE.get(platform_name):
-        _name = ANSIBLE_LIB_MAPPER_REVERSE[platform_name]
-    else:
-        _name = platform_name
-    if NAPALM_LIB_MAPPER_REVERSE.get(platform_name):
-        napalm_driver = NAPALM_LIB_MAPPER_REVERSE[platform_name]
-    else:
-        napalm_driver = platform_name
+    _slug = get_slug(platform_name)
     try:
-        platform_obj = diffsync.platform_map[slugify(platform_name)]
+        platform_obj = diffsync.platform_map[_slug]
     except KeyError:
+        if ANSIBLE_LIB_MAPPER_REVERSE.get(platform_name):
+            _name = ANSIBLE_LIB_MAPPER_REVERSE[platform_name]
+        else:
+            _name = platform_name
+        if NAPALM_LIB_MAPPER_REVERSE.get(platform_name):
+            napalm_driver = NAPALM_LIB_MAPPER_REVERSE[platform_name]
+        else:
+            napalm_driver = platform_name
         platform_obj = Platform(
             name=_name,
-            slug=slugify(platform_name),
+            slug=_slug,
             manufacturer_id=manu,
             napalm_driver=napalm_driver[:50],
         )
         diffsync.objects_to_create["platforms"].append(platform_obj)
-        diffsync.platform_map[slugify(platform_name)] = platform_obj.id
+        diffsync.platform_map[_slug] = platform_obj.id
         platform_obj = platform_obj.id
     return platform_obj
 
@@ -129,12 +150,13 @@ def get_or_create_tag(tag_name: str) -> Tag:
     Returns:
         Tag: Tag object that was found or created.
     """
+    _slug = get_slug(tag_name)
     try:
-        _tag = Tag.objects.get(slug=slugify(tag_name))
+        _tag = Tag.objects.get(slug=_slug)
     except Tag.DoesNotExist:
         new_tag = Tag(
             name=tag_name,
-            slug=slugify(tag_name),
+            slug=_slug,
             color=get_random_color(),
         )
         new_tag.validated_save()
@@ -153,7 +175,14 @@ def get_tags(tag_list: List[str]) -> List[Tag]:
     Returns:
         (List[Tag]): List of Tag object primary keys matching list of strings passed in.
     """
-    return [get_or_create_tag(x) for x in tag_list if x != ""]
+    _names = {get_slug(x): x for x in tag_list if x != ""}
+    if not _names:
+        return []
+    # fetch the existing Tags in one query and only fall back to get_or_create for missing ones
+    _tags = list(Tag.objects.filter(slug__in=_names))
+    _found = {_tag.slug for _tag in _tags}
+    _tags.extend(get_or_create_tag(name) for slug, name in _names.items() if slug not in _found)
+    return _tags
 
 
 def update_tags(tagged_obj: object, new_tags: List[str]):
@@ -163,13 +192,13 @@ def update_tags(tagged_obj: object, new_tags: List[str]):
         tagged_obj (object): Nautobot object with Tags attached.
         new_tags (List[str]): List of updated Tags.
     """
-    current_tags = tagged_obj.tags.names()
-    for tag in new_tags:
-        if tag not in current_tags:
-            tagged_obj.tags.add(tag)
-    for tag in current_tags:
-        if tag not in new_tags:
-            tagged_obj.tags.remove(tag)
+    current_tags = set(tagged_obj.tags.names())
+    added_tags = [tag for tag in new_tags if tag not in current_tags]
+    if added_tags:
+        tagged_obj.tags.add(*added_tags)
+    removed_tags = current_tags.difference(new_tags)
+    if removed_tags:
+        tagged_obj.tags.remove(*removed_tags)
 
 
 def get_tag_strings(list_tags: TaggableManager) -> List[str]:
@@ -215,24 +244,24 @@ def update_custom_fields(new_cfields: dict, update_obj: object):
         new_cfields (OrderedDict): Dictionary of CustomFields on object to be updated to match.
         update_obj (object): Object to be updated with CustomFields.
     """
+    _ct = ContentType.objects.get_for_model(type(update_obj))
     current_cf = get_custom_field_dict(update_obj.get_custom_fields())
     for old_cf, old_cf_dict in current_cf.items():
         if old_cf not in new_cfields:
-            removed_cf = CustomField.objects.get(
-                label=old_cf_dict["key"], content_types=ContentType.objects.get_for_model(type(update_obj))
-            )
+            removed_cf = CustomField.objects.get(label=old_cf_dict["key"], content_types=_ct)
             removed_cf.delete()
     for new_cf, new_cf_dict in new_cfields.items():
+        _name = slugify_dashes_to_underscores(new_cf_dict["key"])
         if new_cf not in current_cf:
             _cf_dict = {
-                "name": slugify_dashes_to_underscores(new_cf_dict["key"]),
-                "slug": slugify_dashes_to_underscores(new_cf_dict["key"]),
+                "name": _name,
+                "slug": _name,
                 "type": CustomFieldTypeChoices.TYPE_TEXT,
                 "label": new_cf_dict["key"],
             }
-            field, _ = CustomField.objects.get_or_create(name=_cf_dict["name"], defaults=_cf_dict)
-            field.content_types.add(ContentType.objects.get_for_model(type(update_obj)).id)
-        update_obj.custom_field_data.update({slugify_dashes_to_underscores(new_cf_dict["key"]): new_cf_dict["value"]})
+            field, _ = CustomField.objects.get_or_create(name=_name, defaults=_cf_dict)
+            field.content_types.add(_ct.id)
+        update_obj.custom_field_data.update({_name: new_cf_dict["value"]})
 
 
 def verify_circuit_type(circuit_type: str) -> CircuitType:
@@ -244,12 +273,13 @@ def verify_circuit_type(circuit_type: str) -> CircuitType:
     Returns:
         CircuitType: CircuitType object found or created.
     """
+    _slug = get_slug(circuit_type)
     try:
-        _ct = CircuitType.objects.get(slug=slugify(circuit_type))
+        _ct = CircuitType.objects.get(slug=_slug)
     except CircuitType.DoesNotExist:
         _ct = CircuitType(
             name=circuit_type,
-            slug=slugify(circuit_type),
+            slug=_slug,
         )
         _ct.validated_save()
     return _ct
@@ -285,6 +315,8 @@ def get_version_from_custom_field(fields: OrderedDict):
 def determine_vc_position(vc_map: dict, virtual_chassis: str, device_name: str) -> int:
     """Determine position of Member Device in Virtual Chassis based on name and other factors.
 
+    The positions for all members are computed once per virtual chassis and stored on its `vc_map` entry.
+
     Args:
         vc_map (dict): Dictionary of virtual chassis positions mapped to devices.
         virtual_chassis (str): Name of the virtual chassis that device is being added to.
@@ -293,7 +325,12 @@ def determine_vc_position(vc_map: dict, virtual_chassis: str, device_name: str)
     Returns:
         int: Position for member device in Virtual Chassis. Will always be position 2 or higher as 1 is master device.
     """
-    return sorted(vc_map[virtual_chassis]["members"]).index(device_name) + 2
+    _vc = vc_map[virtual_chassis]
+    if "member_positions" not in _vc:
+        _vc["member_positions"] = {}
+        for _position, _member in enumerate(sorted(_vc["members"]), start=2):
+            _vc["member_positions"].setdefault(_member, _position)
+    return _vc["member_positions"][device_name]
 
 
 def get_dlc_version_map():
@@ -341,7 +378,7 @@ def apply_vlans_to_port(diffsync, device_name: str, mode: str, vlans: list, port
     """
     try:
         dev = diffsync.get(NautobotDevice, device_name)
-        site_name = slugify(dev.building)
+        site_name = get_slug(dev.building)
     except ObjectNotFound:
         site_name = "global"
     if mode == "access" and len(vlans) == 1: